@@ -99,7 +99,7 @@ extras_require = {
         "ipython", # for drawingboard backend (optional)
     ],
     "numba": [
-        "numba", # for camera (optional)
+        "numba", # for camera and compositing (optional)
     ],
     "numpy": [
         "numpy", # for camera (optional) and vector arrays (required)
@@ -30,9 +30,10 @@ specific language governing rights and limitations under the License.
 
 from typing import Any, Callable
 
-from PIL.Image import Image, frombuffer, merge
+from PIL.Image import Image
 
 from ...lib import typechecked
+from ...lib._argb32 import argb32_to_pil
 from .._abc import VideoABC
 from ._base import BackendBase
 
@@ -79,10 +80,4 @@ class Backend(BackendBase):
         if obj.get_format() != self._Format.ARGB32:
             raise TypeError('ImageSurface uses unhandled format')
 
-        image = frombuffer(
-            mode = 'RGBa',
-            size = (obj.get_width(), obj.get_height()),
-            data = obj.get_data().tobytes(), # call to "tobytes" required because of RGBa mode
-            )
-        b, g, r, a = image.split()
-        return merge('RGBa', (r, g, b, a)).convert("RGBA")
+        return argb32_to_pil(obj)
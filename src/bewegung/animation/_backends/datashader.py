@@ -31,7 +31,6 @@ specific language governing rights and limitations under the License.
 from typing import Any, Callable
 
 from PIL.Image import Image
-from PIL import ImageOps
 
 from ...lib import typechecked
 from .._abc import VideoABC
@@ -51,6 +50,7 @@ class Backend(BackendBase):
         super().__init__()
 
         self._DS_Image = None
+        self._np = None
 
     def _prototype(self, video: VideoABC, **kwargs) -> Callable:
 
@@ -84,13 +84,27 @@ class Backend(BackendBase):
 
         from datashader import Canvas as DS_Canvas
         from datashader.transfer_functions import Image as DS_Image
+        import numpy as np
 
         self._type = DS_Canvas
         self._DS_Image = DS_Image
+        self._np = np
 
     def _to_pil(self, obj: Any) -> Image:
 
-        cvs = obj.to_pil()
+        cvs = obj.to_pil(origin = 'upper') # first row of data on top, i.e. y axis downwards, no flipping required
         if cvs.mode != 'RGBA':
             raise TypeError('unhandled image mode')
-        return ImageOps.flip(cvs) # datashader's y axis must be flipped
+
+        if (
+            cvs.readonly # image shares memory with datashader's array
+            and isinstance(obj.data, self._np.ndarray) # not on GPU
+            and obj.data.dtype == self._np.uint32 and obj.data.ndim == 2 # packed RGBA
+        ):
+            data = obj.data if obj.data.flags.c_contiguous else self._np.ascontiguousarray(obj.data) # compositor requires C layout
+            setattr(cvs, '__bewegung_array__', (
+                cvs.im, # memory is only shared as long as image is not modified in-place
+                data.view(self._np.uint8).reshape(data.shape + (4,)),
+            )) # flag: compositor may use array directly
+
+        return cvs
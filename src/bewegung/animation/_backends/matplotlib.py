@@ -32,9 +32,10 @@ from numbers import Number
 from typing import Any, Callable
 import warnings
 
-from PIL.Image import Image, fromarray, frombuffer, merge
+from PIL.Image import Image, fromarray
 
 from ...lib import Color, typechecked
+from ...lib._argb32 import argb32_to_pil
 from .._abc import VideoABC
 from ._base import BackendBase
 
@@ -136,13 +137,7 @@ class Backend(BackendBase):
 
             surface = obj.canvas._get_printed_image_surface() # returns ARGB32 cairo surface
 
-            image = frombuffer(
-                mode = 'RGBa',
-                size = (surface.get_width(), surface.get_height()),
-                data = surface.get_data().tobytes(), # call to "tobytes" required because of RGBa mode
-                )
-            b, g, r, a = image.split()
-            image = merge('RGBa', (r, g, b, a)).convert("RGBA")
+            image = argb32_to_pil(surface)
 
         if hasattr(obj, '__bewegung_managed__'): # close flagged image
             self._plt.close(obj)
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+"""
+
+BEWEGUNG
+a versatile video renderer
+https://github.com/pleiszenburg/bewegung
+
+    src/bewegung/animation/_composite.py: Layer compositing kernel
+
+    Copyright (C) 2020-2022 Sebastian M. Ernst <ernst@pleiszenburg.de>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to the GNU Lesser General Public License
+Version 2.1 ("LGPL" or "License"). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/old-licenses/lgpl-2.1.txt
+https://github.com/pleiszenburg/bewegung/blob/master/LICENSE
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPORT
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+try:
+    import numpy as np
+    from numba import jit, types
+except ModuleNotFoundError:
+    np, jit = None, None
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# ROUTINES
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+if jit is not None:
+
+    @jit(
+        [
+            (
+                types.Array(types.uint8, 3, 'C'),
+                types.Array(types.uint8, 3, 'C', readonly = True),
+                types.int64, types.int64,
+            ),
+            (
+                types.Array(types.uint8, 3, 'C'),
+                types.Array(types.uint8, 3, 'C'),
+                types.int64, types.int64,
+            ),
+        ],
+        nopython = True,
+        nogil = True,
+        cache = True, # compiled once, re-used by all worker processes and later runs
+    )
+    def composite_jit(frame, layer, x, y):
+        """
+        Blends an RGBA layer onto an opaque frame ("over" operation), in-place.
+        The layer is placed at offset ``x``/``y`` and clipped to the frame.
+        Only the region covered by the layer is touched.
+        Only the first three (color) channels of the frame are written.
+
+        Requires ``numpy`` and ``numba``.
+
+        Args:
+            frame : Frame buffer, ``uint8`` array of shape ``(height, width, channels)``
+            layer : RGBA layer, ``uint8`` array of shape ``(height, width, 4)``
+            x : Horizontal offset of layer within frame
+            y : Vertical offset of layer within frame
+        """
+
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + layer.shape[1], frame.shape[1]), min(y + layer.shape[0], frame.shape[0])
+
+        for row in range(y0, y1):
+            for column in range(x0, x1):
+
+                alpha = np.uint32(layer[row - y, column - x, 3])
+
+                if alpha == 0: # fully transparent, nothing to do
+                    continue
+
+                if alpha == 255: # fully opaque, copy
+                    for channel in range(3):
+                        frame[row, column, channel] = layer[row - y, column - x, channel]
+                    continue
+
+                for channel in range(3):
+                    value = (
+                        np.uint32(layer[row - y, column - x, channel]) * alpha
+                        + np.uint32(frame[row, column, channel]) * (np.uint32(255) - alpha)
+                        + np.uint32(128)
+                    )
+                    frame[row, column, channel] = (value + (value >> np.uint32(8))) >> np.uint32(8) # exact (value - 1) // 255
+
+else:
+
+    composite_jit = None
@@ -30,8 +30,13 @@ specific language governing rights and limitations under the License.
 
 FPS_DEFAULT = 60
 
+FFMPEG_CODEC_DEFAULT = "libx264"
 FFMPEG_CRF_DEFAULT = 17
 FFMPEG_PRESET_DEFAULT = "slow"
 FFPMEG_TUNE_DEFAULT = "animation"
 
 PIPE_BUFFER_DEFAULT = 134217728 # 128 MByte
+
+CHUNK_BYTES_MAX = 67108864 # 64 MByte of raw RGB frames per chunk
+SHARED_BYTES_MAX = 1073741824 # 1 GByte of raw RGB frames in flight, shared memory of all chunks
+CHUNKS_IN_FLIGHT = 2 # per worker process, one being rendered, one waiting for the encoder
@@ -33,7 +33,7 @@ import math
 from PIL import Image as PIL_Image
 
 from ..lib import typechecked
-from ._abc import EffectABC, LayerABC, SequenceABC, TimeABC, VideoABC
+from ._abc import EffectABC, LayerABC, SequenceABC, TimeABC
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 # CLASS: BASE
@@ -53,10 +53,16 @@ class EffectBase(EffectABC):
     def __init__(self):
 
         apply = getattr(self.apply, '__wrapped__', self.apply) # typeguard
-        self._args = apply.__code__.co_varnames[
+        args = apply.__code__.co_varnames[
             1:apply.__code__.co_argcount # excluding self and internal namespace
             ] # parameters requested by user
-        assert self._args[0] == 'cvs' # canvas
+        assert args[0] == 'cvs' # canvas
+
+        params = ('video', 'sequence', 'time', 'reltime') # supported parameters, in order of their codes
+        if any(arg not in params for arg in args[1:]):
+            raise ValueError('unknown argument')
+        self._args = tuple(params.index(arg) for arg in args[1:]) # positional, encoded once
+        self._reltime = 'reltime' in args
 
     def __repr__(self) -> str:
 
@@ -76,15 +82,10 @@ class EffectBase(EffectABC):
         layer.register_effect(self)
         return layer
 
-    def apply_(self,
-        cvs: PIL_Image.Image,
-        video: VideoABC,
-        sequence: SequenceABC,
-        time: TimeABC,
-        ) -> PIL_Image.Image:
+    def apply_(self, cvs, video, sequence, time): # called per frame, not type-checked
         """
         Internal interface for layer objects. Applies the effect to a Pillow Image object and returns the modified image.
-        The function automatically determines what arguments the ``apply`` method of an actual effect requests other than ``cvs``.
+        The arguments the ``apply`` method of an actual effect requests other than ``cvs`` are determined once, on construction.
         Possible options are:
 
         - video: Parent video object
@@ -101,20 +102,14 @@ class EffectBase(EffectABC):
             time : Time within parent video
         """
 
-        kwargs = {}
-        for arg in self._args[1:]:
-            if arg == 'video':
-                kwargs['video'] = video
-            elif arg == 'sequence':
-                kwargs['sequence'] = sequence
-            elif arg == 'time':
-                kwargs['time'] = time
-            elif arg == 'reltime':
-                kwargs['reltime'] = time - sequence.start
-            else:
-                raise ValueError('unknown argument')
-
-        return self.apply(cvs = cvs, **kwargs)
+        values = (
+            video,
+            sequence,
+            time,
+            time - sequence.start if self._reltime else None,
+        ) # indexed by parameter codes
+
+        return self.apply(cvs, *(values[arg] for arg in self._args))
 
     def apply(self, cvs: PIL_Image.Image):
         """
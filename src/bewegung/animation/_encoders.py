@@ -28,19 +28,55 @@ specific language governing rights and limitations under the License.
 # IMPORT
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
+from functools import lru_cache
 from types import TracebackType
-from typing import BinaryIO, Union, Type
-from subprocess import Popen, PIPE, DEVNULL
+from typing import BinaryIO, List, Union, Type
+from subprocess import Popen, PIPE, DEVNULL, SubprocessError, run
 
 from ..lib import typechecked
 from ._abc import EncoderABC, VideoABC
 from ._const import (
     PIPE_BUFFER_DEFAULT,
+    FFMPEG_CODEC_DEFAULT,
     FFMPEG_CRF_DEFAULT,
     FFMPEG_PRESET_DEFAULT,
     FFPMEG_TUNE_DEFAULT,
     )
 
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# ROUTINES
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+@lru_cache(maxsize = None)
+@typechecked
+def _ffmpeg_codec_works(codec: str) -> bool:
+    """
+    Checks whether ``ffmpeg`` can actually encode with a given codec by encoding a single test frame.
+    Hardware codecs may be compiled into ``ffmpeg`` while the hardware itself is absent.
+    The result is cached.
+
+    Args:
+        codec : Name of ``ffmpeg`` video codec
+    """
+
+    try:
+        proc = run(
+            [
+                'ffmpeg',
+                '-f', 'lavfi', # test source
+                '-i', 'color=size=256x256',
+                '-frames:v', '1',
+                '-c:v', codec,
+                '-f', 'null', '-', # discard output
+            ],
+            stdin = DEVNULL, stdout = DEVNULL, stderr = DEVNULL,
+            timeout = 60,
+        )
+    except (OSError, SubprocessError):
+        return False
+
+    return proc.returncode == 0
+
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 # CLASS: BASE
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -51,7 +87,8 @@ class EncoderBase(EncoderABC):
     Encoder classes wrap video encoding tools and libraries such as ``ffmpeg``.
     Encoder objects are callable and return themselves when called. This mechanism is used to (re-) configure the encoder object.
     Encoder objects also use Python's context manager protocol and expose ``BinaryIO`` objects, i.e. streams, as a context for actual encoding.
-    :meth:`bewegung.Video.render` will write rendered images as RGB bitmaps to this stream so the encoder can pick them up.
+    :meth:`bewegung.Video.render` will write rendered images as raw RGB frames to this stream so the encoder can pick them up,
+    i.e. 8 bit per channel, row by row from the top, without headers or padding (``ffmpeg``'s ``rgb24`` pixel format).
     Encoder objects can either be "running" or "idling". They can also either be "configured" or "unconfigured".
     In the latter case, they will not allow to encode a video.
 
@@ -232,6 +269,12 @@ class FFmpegH264Encoder(EncoderBase):
         preset : ``ffmpeg`` encoding and compression preset. See `ffmpeg's H.264 preset documentation`_ for details.
         crf : ``ffmpeg`` Constant Rate Factor (CRF) value. See `ffmpeg's H.264 CRF documentation`_ for details.
         tune : ``ffmpeg`` tune option. See `ffmpeg's H.264 tune documentation`_ for details.
+        codec : ``ffmpeg`` video codec. ``libx264`` encodes on the CPU.
+            ``h264_nvenc`` (Nvidia NVENC) and ``h264_qsv`` (Intel Quick Sync Video) encode on dedicated hardware.
+            For them, ``crf`` is used as a constant quantizer, ``preset`` is approximated and ``tune`` is ignored.
+            ``auto`` selects the first working hardware codec when the encoder starts, falling back to ``libx264``.
+        pix_fmt : ``ffmpeg`` output pixel format, e.g. ``yuv420p`` for compatibility with most players and faster encoding.
+            If omitted, ``ffmpeg`` picks the format closest to the RGB input, i.e. typically ``yuv444p``.
 
     .. _`ffmpeg's H.264 preset documentation`: https://trac.ffmpeg.org/wiki/Encode/H.264#Preset
     .. _`ffmpeg's H.264 CRF documentation`: https://trac.ffmpeg.org/wiki/Encode/H.264#crf
@@ -243,12 +286,16 @@ class FFmpegH264Encoder(EncoderBase):
         preset: str = FFMPEG_PRESET_DEFAULT,
         crf: int = FFMPEG_CRF_DEFAULT,
         tune: str = FFPMEG_TUNE_DEFAULT,
+        codec: str = FFMPEG_CODEC_DEFAULT,
+        pix_fmt: Union[str, None] = None,
     ):
 
         super().__init__()
 
         if buffersize <= 0:
             raise ValueError('buffersize must be greater than 0')
+        if codec not in ('auto', 'libx264') + self._hardware_codecs:
+            raise ValueError('unknown ffmpeg codec')
         if preset not in (
             "ultrafast",
             "superfast",
@@ -272,29 +319,64 @@ class FFmpegH264Encoder(EncoderBase):
             "zerolatency",
             ):
             raise ValueError('unknown ffmpeg tune')
+        if pix_fmt is not None and len(pix_fmt) == 0:
+            raise ValueError('if a string, pix_fmt must not be empty')
 
         self._buffersize = buffersize
         self._preset = preset
         self._crf = crf
         self._tune = tune
+        self._codec = codec
+        self._pix_fmt = pix_fmt
 
         self._proc = None
 
+    _hardware_codecs = ('h264_nvenc', 'h264_qsv') # in order of preference for ``auto``
+
+    def _codec_args(self) -> List[str]:
+        """
+        Internal method: ``ffmpeg`` arguments for selected codec.
+        """
+
+        codec = self._codec
+        if codec == 'auto':
+            codec = next((
+                item for item in self._hardware_codecs if _ffmpeg_codec_works(item)
+            ), 'libx264')
+
+        if codec == 'h264_nvenc':
+            return [
+                '-c:v', codec,
+                '-preset', 'p7' if self._preset in ('slow', 'slower', 'veryslow') else 'p4', # quality versus speed
+                '-rc', 'constqp',
+                '-qp', f'{self._crf:d}',
+            ]
+        if codec == 'h264_qsv':
+            return [
+                '-c:v', codec,
+                '-preset', self._preset if self._preset not in ('ultrafast', 'superfast') else 'veryfast',
+                '-global_quality', f'{self._crf:d}',
+            ]
+        return [
+            '-c:v', codec,
+            '-preset', self._preset,
+            '-crf', f'{self._crf:d}',
+            '-tune', self._tune,
+        ]
+
     def _enter(self) -> BinaryIO:
 
         self._proc = Popen(
             [
                 'ffmpeg',
                 '-y', # force overwrite of output file
+                '-f', 'rawvideo', # force input format, no container or headers
+                '-pix_fmt', 'rgb24', # input pixel format
+                '-s:v', f'{self._width:d}x{self._height:d}',
                 '-framerate', f'{self._fps:d}',
-                '-f', 'image2pipe', # force input format
                 '-i', '-', # data from stdin
-                '-vcodec', 'bmp', # input codec
-                '-s:v', f'{self._width:d}x{self._height:d}',
-                '-c:v', 'libx264',
-                '-preset', self._preset,
-                '-crf', f'{self._crf:d}',
-                '-tune', self._tune,
+                *self._codec_args(),
+                *([] if self._pix_fmt is None else ['-pix_fmt', self._pix_fmt]),
                 self._video_fn,
             ],
             stdin = PIPE, stdout = DEVNULL, stderr = DEVNULL,
@@ -340,11 +422,11 @@ class FFmpegGifEncoder(EncoderBase):
             [
                 'ffmpeg',
                 '-y', # force overwrite of output file
+                '-f', 'rawvideo', # force input format, no container or headers
+                '-pix_fmt', 'rgb24', # input pixel format
+                '-s:v', f'{self._width:d}x{self._height:d}',
                 '-framerate', f'{self._fps:d}',
-                '-f', 'image2pipe', # force input format
                 '-i', '-', # data from stdin
-                '-vcodec', 'bmp', # input codec
-                '-s:v', f'{self._width:d}x{self._height:d}',
                 '-vf', 'split[s0][s1];[s0]palettegen[p];[s1][p]paletteuse',
                 '-c:v', 'gif',
                 self._video_fn,
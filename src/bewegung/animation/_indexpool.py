@@ -50,6 +50,7 @@ class IndexPool(IndexPoolABC):
     def __init__(self):
 
         self._pool = set()
+        self._max, self._min = None, None # tracked on registration, indices are never removed
 
     def __repr__(self) -> str:
 
@@ -78,7 +79,10 @@ class IndexPool(IndexPoolABC):
         Highest index currently present in pool
         """
 
-        return max(self._pool)
+        if len(self) == 0:
+            raise ValueError('pool is empty')
+
+        return self._max
 
     @property
     def min(self) -> int:
@@ -86,7 +90,10 @@ class IndexPool(IndexPoolABC):
         Lowest index currently present in pool
         """
 
-        return min(self._pool)
+        if len(self) == 0:
+            raise ValueError('pool is empty')
+
+        return self._min
 
     def as_list(self) -> List[int]:
         """
@@ -123,3 +130,8 @@ class IndexPool(IndexPoolABC):
             raise IndexError('index is already present in pool')
 
         self._pool.add(index)
+
+        if self._max is None or index > self._max:
+            self._max = index
+        if self._min is None or index < self._min:
+            self._min = index
@@ -35,7 +35,7 @@ from PIL import Image as PIL_Image
 
 from ..lib import typechecked
 from ..linalg import Vector2D
-from ._abc import EffectABC, LayerABC, SequenceABC, TimeABC, VideoABC
+from ._abc import EffectABC, LayerABC, VideoABC
 from ._backends import backends
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -58,6 +58,9 @@ class Layer(LayerABC):
         canvas : A function pointer to a factory function, generating a new canvas once per frame for the ``layer`` task.
             The pointer is typically generated by the :meth:`bewegung.Video.canvas` method.
         offset : The layer's offset relative to the top-left corner of the video. The y-axis is downwards positive.
+        reuse_canvas : If ``True``, the canvas is allocated once per worker process and cleared in-place before every frame
+            instead of being generated anew. Only supported for pillow images, cairo surfaces and datashader canvases,
+            other canvases are always generated anew.
     """
 
     def __init__(self,
@@ -66,6 +69,7 @@ class Layer(LayerABC):
         video: VideoABC,
         canvas: Union[Callable, None] = None,
         offset: Union[Vector2D, None] = None,
+        reuse_canvas: bool = False,
     ):
 
         # consistency checks are performed in Video.layer
@@ -79,24 +83,41 @@ class Layer(LayerABC):
         self._canvas = self._video.canvas() if canvas is None else canvas
         self._offset = offset
         self._effects = []
+        self._reuse_canvas = reuse_canvas
+        self._canvas_cache = None # tuple of canvas and its blank state, if reused
+        self._backend = None # backend which recognized the canvas of the previous frame
 
-        self._args = self._method.__code__.co_varnames[
+        params = ('time', 'reltime', 'canvas') # supported parameters, in order of their codes
+        args = self._method.__code__.co_varnames[
             1:self._method.__code__.co_argcount # excluding self and internal namespace
             ] # parameters requested by user
+        if any(arg not in params for arg in args):
+            raise ValueError('unknown parameter')
+        self._args = tuple(params.index(arg) for arg in args) # positional, encoded once
+        self._reltime = 'reltime' in args
+        self._canvas_requested = 'canvas' in args
 
     def __repr__(self) -> str:
 
         return f'<Layer name={self._method.__name__:s} zindex={self._zindex_tag:d}>'
 
-    def __call__(self, sequence: SequenceABC, time: TimeABC) -> PIL_Image.Image:
+    def __getstate__(self) -> dict:
+
+        state = self.__dict__.copy()
+        state['_canvas_cache'] = None # canvases are reused per process, cairo surfaces can not be pickled
+        state['_backend'] = None # backends may hold references to modules
+
+        return state
+
+    def __call__(self, sequence, time): # called per frame, not type-checked
         """
         Wraps layer method from a user-defined sequence class.
-        This method determines what parameters the user-defined layer method requested.
+        The parameters requested by the user-defined layer method are determined once, on construction.
         Possible options are:
 
         - ``time``: The absolute time within the parent video
         - ``reltime``: The relative time within the parent sequence
-        - ``canvas``: An empty canvas
+        - ``canvas``: An empty canvas, either new or cleared (if reused)
 
         Subsequently, the user-defined layer method is called with the requested parameters.
         It then converts the returned canvas to a Pillow Image object
@@ -108,21 +129,19 @@ class Layer(LayerABC):
             time : Time within video
         """
 
-        kwargs = {}
-        cvs_start = None
-
-        for param in self._args:
-            if param == 'time':
-                kwargs[param] = time
-            elif param == 'reltime':
-                kwargs[param] = time - sequence.start
-            elif param == 'canvas':
-                kwargs[param] = self._canvas()
-                cvs_start = kwargs[param]
-            else:
-                raise ValueError('unknown parameter')
-
-        cvs = self._method(sequence, **kwargs)
+        if not self._canvas_requested:
+            cvs_start = None
+        elif self._reuse_canvas:
+            cvs_start = self._recycle_canvas()
+        else:
+            cvs_start = self._canvas()
+        values = (
+            time,
+            time - sequence.start if self._reltime else None,
+            cvs_start,
+        ) # indexed by parameter codes
+
+        cvs = self._method(sequence, *(values[arg] for arg in self._args))
         if cvs is None:
             if cvs_start is not None:
                 cvs = cvs_start
@@ -169,17 +188,66 @@ class Layer(LayerABC):
 
         self._effects.append(effect)
 
-    def _to_pil(self, obj: Any) -> PIL_Image.Image:
+    def _recycle_canvas(self): # called per frame, not type-checked
+        """
+        Returns the canvas of the previous frame, cleared in-place, or a new canvas if it can not be reused.
+        """
+
+        if self._canvas_cache is None:
+            cvs = self._canvas()
+            if isinstance(cvs, PIL_Image.Image):
+                self._canvas_cache = (cvs, self._clear_pillow(cvs))
+            elif backends['cairo'].isinstance(cvs):
+                self._canvas_cache = (cvs, self._clear_cairo)
+            elif backends['datashader'].loaded and isinstance(cvs, backends['datashader'].type):
+                self._canvas_cache = (cvs, None) # configuration only, nothing is drawn onto it
+            return cvs
+
+        cvs, clear = self._canvas_cache
+        if clear is not None:
+            clear(cvs)
+
+        return cvs
+
+    @staticmethod
+    def _clear_pillow(cvs: PIL_Image.Image) -> Callable:
+        """
+        Returns a function restoring a pillow image to its current (blank) state, retaining its background color.
+        """
+
+        blank = cvs.copy()
+
+        return lambda obj: obj.paste(blank)
+
+    @staticmethod
+    def _clear_cairo(cvs: Any):
+        """
+        Clears a cairo surface, i.e. makes it fully transparent.
+        """
+
+        from cairo import Context, OPERATOR_CLEAR
+
+        ctx = Context(cvs)
+        ctx.set_operator(OPERATOR_CLEAR)
+        ctx.paint()
+        cvs.flush()
+
+    def _to_pil(self, obj): # called per frame, not type-checked
         """
         Detects the datatype of the canvas returned by the user-defined layer method and tries to convert it to a Pillow Image.
+        The backend of the previous frame is tried first.
         Raises a type error if none of the currently loaded backends recognizes the canvas type.
 
         Args:
             obj : A canvas object
         """
 
+        if self._backend is not None and self._backend.isinstance(obj):
+            return self._backend.to_pil(obj)
+
         for backend in backends.values():
             if backend.isinstance(obj, hard = False):
+                self._backend = backend
                 return backend.to_pil(obj)
 
         raise TypeError('unknown or unloaded backend canvas type coming from layer')
@@ -74,3 +74,8 @@ class Task(TaskABC):
     def sequence(self) -> SequenceABC:
 
         return self._sequence
+
+    @property
+    def task(self) -> Callable:
+
+        return self._task
@@ -82,38 +82,38 @@ class Time(TimeABC):
 
     def __eq__(self, other: TimeABC) -> bool:
         self._assert_fps(other)
-        return self.index == other.index
+        return self._index == other._index
 
     def __lt__(self, other: TimeABC) -> bool:
         self._assert_fps(other)
-        return self.index < other.index
+        return self._index < other._index
 
     def __le__(self, other: TimeABC) -> bool:
         self._assert_fps(other)
-        return self.index <= other.index
+        return self._index <= other._index
 
     def __gt__(self, other: TimeABC) -> bool:
         self._assert_fps(other)
-        return self.index > other.index
+        return self._index > other._index
 
     def __ge__(self, other: TimeABC) -> bool:
         self._assert_fps(other)
-        return self.index >= other.index
+        return self._index >= other._index
 
     def __add__(self, other: TimeABC) -> TimeABC:
         self._assert_fps(other)
-        return type(self)(self.fps, self.index + other.index)
+        return type(self)(self._fps, self._index + other._index)
 
     def __sub__(self, other: TimeABC) -> TimeABC:
         self._assert_fps(other)
-        return type(self)(self.fps, self.index - other.index)
+        return type(self)(self._fps, self._index - other._index)
 
     def __truediv__(self, other: TimeABC) -> float:
         self._assert_fps(other)
-        return self.index / other.index
+        return self._index / other._index
 
     def _assert_fps(self, other):
-        if self.fps != other.fps:
+        if self._fps != other._fps:
             raise ValueError()
 
     @property
@@ -28,21 +28,31 @@ specific language governing rights and limitations under the License.
 # IMPORT
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
-import inspect
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import heapq
 import multiprocessing as mp
-from typing import Callable, Dict, Union
+from multiprocessing.pool import Pool
+from operator import itemgetter
+import os
+import queue
+import sys
+import threading
+import warnings
+from typing import Any, BinaryIO, Callable, Dict, Generator, Iterable, List, Tuple, Union
 
 from PIL import Image as PIL_Image
 try:
     from tqdm import tqdm
 except ModuleNotFoundError:
-    tqdm = lambda x: x
+    tqdm = lambda x, **kwargs: x
 
 from ..lib import typechecked
 from ..linalg import Vector2D
 from ._abc import EncoderABC, LayerABC, SequenceABC, VideoABC, TimeABC
 from ._backends import backends
-from ._const import FPS_DEFAULT
+from ._composite import composite_jit, np
+from ._const import CHUNK_BYTES_MAX, CHUNKS_IN_FLIGHT, FPS_DEFAULT, SHARED_BYTES_MAX
 from ._encoders import FFmpegH264Encoder
 from ._indexpool import IndexPool
 from ._layer import Layer
@@ -54,7 +64,7 @@ from ._time import Time
 # "GLOBALS" (FOR WORKERS)
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
-_workers = {}
+_worker = None # video object, shared frame memory and options of worker process, inherited via fork or set by initializer
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 # CLASS
@@ -117,6 +127,10 @@ class Video(VideoABC):
 
         self._preptasks = [] # list of sequence prepare tasks
         self._layertasks = [] # list of layer render tasks
+        self._dirty = True # tasks and program must be (re-) built on next reset
+        self._program = [] # per frame: tuples of active prepare and layer task methods
+        self._buffer = None # frame buffer for compositing with pillow, allocated on demand and re-used
+        self._buffer_dirty = None # box within frame buffer touched by previous frame, if any
         self._preporder = IndexPool()
         self._zindex = IndexPool()
 
@@ -227,34 +241,53 @@ class Video(VideoABC):
         This method allows to reset a video object in preparation of a new render run.
         It is automatically invoked when calling :meth:`bewegung.Video.render`.
         It may instead be used before rendering indivual frames with :meth:`bewegung.Video.render_frame`.
+        It also determines the prepare and layer tasks active in every frame once,
+        so rendering a frame does not check the time spans of sequences.
         """
 
         for sequence in self._sequences:
             sequence.reset()
 
+        self._buffer, self._buffer_dirty = None, None # not carried over into (spawned) worker processes
+
+        if not self._dirty: # no new sequences, prepare or layer tasks since last reset
+            return
+
         self._preptasks.clear()
-        self._preptasks.extend([
-            Task(
-                sequence = sequence,
-                index = getattr(sequence, attr).preporder_tag,
-                task = getattr(sequence, attr),
-            )
-            for sequence in self._sequences for attr in dir(sequence)
-            if hasattr(getattr(sequence, attr), 'preporder_tag')
-        ]) # find prepare methods based on tags
-        self._preptasks.sort() # sort by preporder
+        self._preptasks.extend(
+            Task(sequence = sequence, index = tag, task = getattr(sequence, attr))
+            for tag, sequence, attr in sorted((
+                (tag, sequence, attr) for sequence in self._sequences for attr, tag in sequence._preptags
+            ), key = itemgetter(0)) # stable sort by preporder, tags collected by sequence decorator
+        ) # prepare methods
 
         self._layertasks.clear()
-        self._layertasks.extend([
-            Task(
-                sequence = sequence,
-                index = getattr(sequence, attr).zindex_tag,
-                task = getattr(sequence, attr),
-            )
-            for sequence in self._sequences for attr in dir(sequence)
-            if hasattr(getattr(sequence, attr), 'zindex_tag')
-        ]) # find layer methods based on tags
-        self._layertasks.sort() # sort by (z-) index
+        self._layertasks.extend(
+            Task(sequence = sequence, index = tag, task = getattr(sequence, attr))
+            for tag, sequence, attr in sorted((
+                (tag, sequence, attr) for sequence in self._sequences for attr, tag in sequence._layertags
+            ), key = itemgetter(0)) # stable sort by (z-) index, tags collected by sequence decorator
+        ) # layer methods
+
+        boundaries = sorted({0, len(self)} | {
+            min(max(index, 0), len(self))
+            for sequence in self._sequences
+            for index in (sequence.start.index, sequence.stop.index)
+        }) # set of active sequences can only change here
+        variants = {} # unique combinations of active tasks, shared among frames
+        self._program.clear()
+        for start, stop in zip(boundaries[:-1], boundaries[1:]): # segments of frames
+            active = {
+                id(sequence) for sequence in self._sequences
+                if sequence.start.index <= start < sequence.stop.index
+            } # check every sequence only once per segment
+            program = tuple(
+                tuple(task.task for task in tasks if id(task.sequence) in active) # bound methods, called directly
+                for tasks in (self._preptasks, self._layertasks)
+            ) # prepare tasks return None, layer tasks return images
+            self._program.extend([variants.setdefault(program, program)] * (stop - start))
+
+        self._dirty = False
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 # DECORATOR: SEQUENCE (TYPE)
@@ -313,12 +346,24 @@ class Video(VideoABC):
         @typechecked
         def decorator(cls: type):
 
-            cls_bases, sequence_bases = inspect.getmro(cls), inspect.getmro(Sequence)
-            bases = tuple([item for item in sequence_bases if item not in cls_bases]) + cls_bases
-            SequenceCls = type(cls.__name__, bases, Sequence.__dict__.copy())
+            SequenceCls = type(cls.__name__, (Sequence, cls), {'__module__': cls.__module__}) # Sequence takes precedence, its reset calls cls.__init__
+            members = {}
+            for base in reversed(SequenceCls.__mro__):
+                members.update(vars(base)) # class attributes as resolved by inheritance, no descriptors invoked
+            SequenceCls._preptags = [
+                (attr, member.preporder_tag)
+                for attr, member in sorted(members.items(), key = itemgetter(0))
+                if hasattr(member, 'preporder_tag')
+            ] # find prepare methods based on tags, once per class
+            SequenceCls._layertags = [
+                (attr, member.zindex_tag)
+                for attr, member in sorted(members.items(), key = itemgetter(0))
+                if isinstance(member, LayerABC)
+            ] # find layer methods, once per class
             sequence = SequenceCls(start = start, stop = stop, video = self)
 
             self._sequences.append(sequence)
+            self._dirty = True
             return sequence # HACK return object, not class
 
         return decorator
@@ -343,25 +388,29 @@ class Video(VideoABC):
             preporder = self._preporder.on_top()
 
         self._preporder.register(preporder) # ensure unique preporder
+        self._dirty = True
 
         @typechecked
         def decorator(method: Callable) -> Callable:
 
-            @typechecked
-            def wrapper(sequence: SequenceABC, time: Time):
+            params = ('time', 'reltime') # supported parameters, in order of their codes
+            args = method.__code__.co_varnames[
+                1:method.__code__.co_argcount # excluding self and internal namespace
+            ] # parameters requested by user
+            for arg in args:
+                if arg not in params:
+                    raise ValueError('unknown parameter', arg)
+            codes = tuple(params.index(arg) for arg in args) # positional, encoded once
+            reltime = 'reltime' in args
+
+            def wrapper(sequence: SequenceABC, time: Time): # called per frame, not type-checked
 
-                kwargs = {}
-                for param in method.__code__.co_varnames[
-                    1:method.__code__.co_argcount # excluding self and internal namespace
-                ]: # parameters requested by user
-                    if param == 'time':
-                        kwargs[param] = time
-                    elif param == 'reltime':
-                        kwargs[param] = time - sequence.start
-                    else:
-                        raise ValueError('unknown parameter', param)
+                values = (
+                    time,
+                    time - sequence.start if reltime else None,
+                ) # indexed by parameter codes
 
-                method(sequence, **kwargs) # let user draw layer/canvas for frame
+                method(sequence, *(values[code] for code in codes)) # let user prepare sequence for frame
 
             wrapper.preporder_tag = preporder # tag wrapper function
             return wrapper
@@ -376,6 +425,7 @@ class Video(VideoABC):
         zindex: Union[int, None] = None,
         canvas: Union[Callable, None] = None,
         offset: Union[Vector2D, None] = None,
+        reuse_canvas: bool = False,
     ) -> Callable:
         """
         A **decorator** for decorating ``layer`` methods (tasks) within ``sequence`` classes.
@@ -388,6 +438,10 @@ class Video(VideoABC):
             canvas : A function pointer to a factory function, generating a new canvas once per frame for the ``layer`` task.
                 The pointer is typically generated by the :meth:`bewegung.Video.canvas` method.
             offset : The layer's offset relative to the top-left corner of the video. The y-axis is downwards positive.
+            reuse_canvas : If ``True``, the canvas is allocated once per worker process and cleared before every frame
+                instead of being generated anew, saving memory allocations.
+                The ``layer`` task must not rely on the canvas being a new object or keep references to it across frames.
+                Only supported for pillow images, cairo surfaces and datashader canvases, other canvases are always generated anew.
         """
 
         if offset is None:
@@ -396,6 +450,7 @@ class Video(VideoABC):
             zindex = self._zindex.on_top()
 
         self._zindex.register(zindex) # ensure unique z-index
+        self._dirty = True
 
         @typechecked
         def decorator(method: Callable) -> LayerABC:
@@ -406,6 +461,7 @@ class Video(VideoABC):
                 video = self,
                 canvas = canvas,
                 offset = offset,
+                reuse_canvas = reuse_canvas,
             ) # callable object (pretending to be a method)
 
         return decorator
@@ -432,7 +488,10 @@ class Video(VideoABC):
 
     def render(self,
         processes: int = 1,
-        batchsize: int = 256,
+        batchsize: Union[int, None] = None,
+        chunksize: Union[int, None] = None,
+        affinity: bool = False,
+        threads: int = 1,
         encoder: Union[EncoderABC, None] = None,
         frame_fn: Union[str, None] = None,
         video_fn: Union[str, None] = None,
@@ -447,7 +506,22 @@ class Video(VideoABC):
         Args:
             processes : Number of parallel frame rendering (worker) processes
             batchsize : Maximum number of frames rendered by a worker process before the (old) worker is replaced by a new worker.
-                This option helps to prevent long rendering jobs from running out of memory.
+                This option helps to prevent long rendering jobs from running out of memory, e.g. due to leaks in user code.
+                If omitted, worker processes persist for the entire rendering job,
+                keeping imported modules and compiled ``numba`` kernels alive.
+            chunksize : Number of consecutive frames handed to a worker process at once.
+                Larger chunks reduce inter-process communication overhead.
+                If omitted, frames are split into about four chunks per worker process.
+                If frames are streamed to a video encoder, every chunk in flight occupies shared memory of
+                ``chunksize * width * height * 3`` bytes, allocated up front, with up to two chunks in flight per worker process.
+                Chunks are therefore limited to 64 MiB of raw frame data (at least one frame) and all chunks in flight to 1 GiB,
+                whether ``chunksize`` is specified or not. Larger values are reduced with a warning.
+                If a single frame per worker process exceeds 1 GiB in total, a ``ValueError`` is raised.
+            affinity : If ``True``, every worker process is pinned to its own CPU core (round robin),
+                which keeps its caches warm. Only supported on Linux, ignored elsewhere.
+            threads : Number of threads per worker process running the layer tasks of a frame concurrently.
+                Useful for few but large frames with multiple expensive layers, e.g. if backends release the GIL.
+                Compositing remains sequential. If greater than ``1``, layer tasks must be thread-safe.
             encoder : A video encoder object.
                 If omitted, a :class:`bewegung.FFmpegH264Encoder` object will generated and used.
             frame_fn : A Python string (representing a path) including an integer `replacement field`_ called ``index``.
@@ -462,8 +536,12 @@ class Video(VideoABC):
 
         if processes <= 0:
             raise ValueError('processes must be greater than 0')
-        if batchsize <= 0:
+        if batchsize is not None and batchsize <= 0:
             raise ValueError('batchsize must be greater than 0')
+        if chunksize is not None and chunksize <= 0:
+            raise ValueError('chunksize must be greater than 0')
+        if threads <= 0:
+            raise ValueError('threads must be greater than 0')
 
         if video_fn is not None and len(video_fn) == 0:
             raise ValueError('if a string, video_fn must not be empty')
@@ -472,37 +550,83 @@ class Video(VideoABC):
 
         self.reset()
 
-        workers = mp.Pool(
+        if chunksize is None:
+            chunksize = max(len(self) // (4 * processes), 1) # balances load among workers
+        elif video_fn is not None and chunksize > self._chunksize_max(processes):
+            warnings.warn(f'chunksize reduced from {chunksize:d} to {self._chunksize_max(processes):d} frames, limited by memory per chunk')
+        if video_fn is not None:
+            chunksize = min(chunksize, self._chunksize_max(processes)) # bounds memory per chunk
+
+        if 'fork' in mp.get_all_start_methods() and sys.platform != 'darwin': # fork is unsafe on macOS
+            context = mp.get_context('fork') # workers inherit video object, no pickling required
+        else:
+            context = mp.get_context() # e.g. Windows, video object must be pickled for every worker
+
+        stride = chunksize * self._width * self._height * 3 # bytes per chunk of RGB frames
+        slots = CHUNKS_IN_FLIGHT * processes # chunks in flight
+        if video_fn is not None:
+            slots = max(min(slots, SHARED_BYTES_MAX // stride), processes) # at least one chunk per worker
+            if slots * stride > SHARED_BYTES_MAX:
+                raise ValueError(
+                    f'{processes:d} processes require {slots * stride:d} bytes of shared memory for frames in flight, '
+                    f'exceeding the limit of {SHARED_BYTES_MAX:d} bytes - reduce the number of processes'
+                )
+        shared = context.RawArray('B', slots * stride) if video_fn is not None else None # frames are not pickled
+
+        global _worker
+        worker = (self, shared, stride, threads, frame_fn) # constant for entire rendering job
+        if context.get_start_method() == 'fork':
+            _worker = worker
+            worker = None
+
+        if affinity and hasattr(os, 'sched_setaffinity'):
+            cores = sorted(os.sched_getaffinity(0))
+            counter = context.Value('i', 0) # shared among workers, determines core
+        else:
+            cores, counter = None, None
+
+        if worker is None and cores is None:
+            initializer, initargs = None, tuple()
+        else:
+            initializer, initargs = self._worker_init, (worker, cores, counter)
+
+        workers = context.Pool(
             processes = processes,
-            initializer = self._worker_init,
-            initargs = (self,),
+            initializer = initializer,
+            initargs = initargs,
             maxtasksperchild = batchsize,
         )
-        workers_promises = [
-            workers.apply_async(
-                func = self._worker_render_frame,
-                args = (time, video_fn is not None, frame_fn),
-                error_callback = self._worker_error,
-            ) for time in Time.range(self.time(0), self._length)
-        ]
+        frames = self._worker_frames(
+            workers = workers,
+            chunksize = chunksize,
+            slots = slots,
+            shared = shared,
+        )
 
-        if video_fn is None:
+        try:
 
-            for promise in tqdm(workers_promises):
-                _ = promise.get()
+            if video_fn is None:
 
-        else:
+                for _ in tqdm(frames, total = self._length.index):
+                    pass
+
+            else:
+
+                with encoder(video = self, video_fn = video_fn) as stream:
+                    self._encode_frames(
+                        frames = tqdm(frames, total = self._length.index),
+                        stream = stream,
+                        queuesize = 2 * processes,
+                    )
 
-            with encoder(video = self, video_fn = video_fn) as stream:
-                for promise in tqdm(workers_promises):
-                    frame = promise.get()
-                    frame.save(stream, 'bmp')
-                    stream.flush()
-                    frame.close()
+        finally:
 
-        workers.close()
-        workers.terminate()
-        workers.join()
+            frames.close() # stop feeding frames to workers
+            workers.close()
+            workers.terminate()
+            workers.join()
+
+            _worker = None
 
     def render_frame(self,
         time: Time,
@@ -524,21 +648,7 @@ class Video(VideoABC):
             If requested via ``return_frame``, a pillow image object is returned.
         """
 
-        for preptask in self._preptasks:
-            if time in preptask.sequence:
-                preptask(time)
-
-        layers = [
-            layertask(time)
-            for layertask in self._layertasks
-            if time in layertask.sequence # only render layer if time within sequence
-        ] # call layer render functions, get list of uni-size PIL images
-
-        base_layer = PIL_Image.new('RGBA', (self._width, self._height), (0, 0, 0, 0)) # transparent black
-        for layer in layers:
-            base_layer.paste(im = layer, box = layer.offset.as_tuple(), mask = layer)
-
-        base_layer = base_layer.convert('RGB') # go from RGBA to RGB
+        base_layer = self._render_frame(time)
 
         if frame_fn is not None:
             base_layer.save(frame_fn.format(index = time.index))
@@ -546,21 +656,292 @@ class Video(VideoABC):
         if return_frame:
             return base_layer # for direct to video
 
+    def _render_frame(self, time, buffer = None, image = True, threads = None): # called per frame, not type-checked
+        """
+        Internal method: Renders a frame, optionally into a caller-provided buffer.
+
+        Args:
+            time : Time of the frame relative to the beginning of the video
+            buffer : Writable buffer receiving the frame as raw RGB data.
+                The ``numba`` kernel composites into it directly, the pillow fallback copies the frame into it.
+            image : If ``True``, the frame is returned as a pillow image.
+            threads : If provided, layer tasks are run concurrently on these threads.
+        Returns:
+            If requested via ``image``, the frame as an RGB pillow image.
+            If rendered into ``buffer`` by the ``numba`` kernel, the image shares its memory.
+        """
+
+        preptasks, layertasks = self._program[time.index] if 0 <= time.index < len(self._program) else (tuple(), tuple())
+
+        for task in preptasks: # in order, before any layer
+            task(time)
+
+        if threads is None or len(layertasks) < 2:
+            layers = (task(time) for task in layertasks) # only one layer image alive at a time
+        else:
+            layers = threads.map(lambda task: task(time), layertasks) # results in order of z-index
+
+        if composite_jit is None:
+            frame = self._composite_pil(layers) # opaque RGBA
+            if buffer is not None:
+                buffer[:] = frame.tobytes('raw', 'RGB') # drops alpha while packing, no conversion
+            return frame.convert('RGB') if image else None
+
+        frame = self._composite_jit(layers, buffer)
+        if image:
+            return frame
+        frame.close()
+
+    def _composite_pil(self, layers): # called per frame, not type-checked
+        """
+        Internal method: Composites layers with pillow.
+        Fallback if ``numpy`` and ``numba`` are not present.
+        Returns an opaque RGBA image which may be a re-used buffer, i.e. it is only valid until the next call.
+
+        Args:
+            layers : Layer images of this frame, in order of z-index
+        """
+
+        if self._buffer is None:
+            self._buffer = PIL_Image.new('RGBA', (self._width, self._height), (0, 0, 0, 255)) # opaque black
+        elif self._buffer_dirty is not None:
+            self._buffer.paste((0, 0, 0, 255), self._buffer_dirty) # only clear what previous frame touched
+        self._buffer_dirty = None
+
+        frame = self._buffer
+        for layer in layers:
+            x, y = layer.offset.as_tuple()
+            if x == 0 and y == 0 and layer.size == frame.size: # full-frame layer, no crop and paste required
+                frame = PIL_Image.alpha_composite(frame, layer) # new image, buffer remains untouched
+            else:
+                frame.alpha_composite(
+                    layer,
+                    dest = (max(x, 0), max(y, 0)),
+                    source = (max(-x, 0), max(-y, 0)), # negative offsets crop the layer instead
+                ) # "over" operation on affected area only
+                if frame is self._buffer:
+                    self._buffer_dirty = self._union_box(self._buffer_dirty, (
+                        max(x, 0), max(y, 0),
+                        min(x + layer.width, self._width), min(y + layer.height, self._height),
+                    ))
+            del layer # release layer image as early as possible
+
+        return frame # opaque, alpha channel is dropped by caller
+
+    @staticmethod
+    def _union_box(box, other): # called per layer, not type-checked
+        """
+        Internal method: Smallest box containing two boxes, ignoring empty ones.
+
+        Args:
+            box : Box as ``(left, upper, right, lower)`` or ``None`` (empty)
+            other : Box as ``(left, upper, right, lower)``, possibly empty
+        """
+
+        if other[0] >= other[2] or other[1] >= other[3]: # empty, e.g. layer outside of frame
+            return box
+        if box is None:
+            return other
+
+        return (min(box[0], other[0]), min(box[1], other[1]), max(box[2], other[2]), max(box[3], other[3]))
+
+    def _composite_jit(self, layers, buffer = None): # called per frame, not type-checked
+        """
+        Internal method: Composites layers directly into an RGB ``numpy`` array with a ``numba`` kernel.
+        Unless a buffer is provided, a new array is used for every frame because the returned image shares its memory.
+
+        Args:
+            layers : Layer images of this frame, in order of z-index
+            buffer : Writable buffer of raw RGB data to composite into
+        """
+
+        if buffer is None:
+            frame = np.zeros((self._height, self._width, 3), dtype = np.uint8) # black, RGB only
+        else:
+            frame = np.frombuffer(buffer, dtype = np.uint8).reshape(self._height, self._width, 3)
+            frame.fill(0) # black
+
+        for layer in layers:
+            x, y = layer.offset.as_tuple()
+            shared = getattr(layer, '__bewegung_array__', None) # image and array provided by backend
+            composite_jit(frame, shared[1] if shared is not None and shared[0] is layer.im else np.asarray(layer), x, y)
+            del layer # release layer image as early as possible
+
+        return PIL_Image.frombuffer(
+            'RGB', (self._width, self._height), frame, 'raw', 'RGB', 0, 1,
+        ) # shares memory with frame, no conversion or copy
+
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 # WORKER INFRASTRUCTURE
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
+    def _chunksize_max(self, processes: int) -> int:
+        """
+        Maximum number of frames per chunk (at least one frame), bounded by memory of raw RGB frames per chunk
+        and by shared memory of all chunks in flight, i.e. up to two chunks per worker process
+
+        Args:
+            processes : Number of worker processes
+        """
+
+        size = self._width * self._height * 3 # bytes per RGB frame
+
+        return max(min(CHUNK_BYTES_MAX // size, SHARED_BYTES_MAX // (CHUNKS_IN_FLIGHT * processes * size)), 1)
+
+    def _worker_frames(self,
+        workers: Pool,
+        chunksize: int,
+        slots: int,
+        shared: Any,
+        ) -> Generator:
+        """
+        Internal generator: Dispatches frames to worker processes and yields results in order.
+
+        Frames are fed to ``imap_unordered`` lazily, in chunks of ``chunksize`` consecutive frames.
+        Every chunk in flight occupies one of ``slots`` slots. If frames are requested, every slot is a region in shared memory
+        into which a worker process renders the chunk's frames as contiguous raw RGB data, so frames are never pickled.
+        Once all of its predecessors are available, a chunk is copied out of shared memory at once,
+        its slot is handed to the next chunk and its frames are yielded as slices of the copy.
+        If frames are not requested, ``None`` is yielded per frame.
+        Chunks finishing early are held back on a heap, so a slow chunk does not stall its successors, only their release.
+
+        Args:
+            workers : Pool of worker processes
+            chunksize : Number of consecutive frames per task
+            slots : Maximum number of chunks in flight
+            shared : Shared memory of ``slots`` chunks (``RawArray``), or ``None`` if frames are not requested
+        """
+
+        free = queue.Queue() # slots available for chunks
+        for slot in range(slots):
+            free.put(slot)
+        stop = threading.Event()
+        size = self._width * self._height * 3 # bytes per RGB frame
+        view = None if shared is None else memoryview(shared).cast('B')
+
+        def chunks(): # consumed by the pool's task handler thread
+            for start in range(0, self._length.index, chunksize):
+                slot = free.get()
+                if stop.is_set():
+                    return
+                yield start, min(chunksize, self._length.index - start), slot # options are known to workers
+
+        heap = []
+        expected = 0
+
+        try:
+            for start, length, slot in workers.imap_unordered(self._worker_render_chunk, chunks()):
+                heapq.heappush(heap, (start, length, slot)) # starts are unique
+                while len(heap) > 0 and heap[0][0] == expected:
+                    _, length, slot = heapq.heappop(heap)
+                    expected += length
+                    if view is None:
+                        free.put(slot)
+                        yield from (None for _ in range(length))
+                        continue
+                    data = memoryview(bytes(view[slot * chunksize * size:(slot * chunksize + length) * size])) # one copy
+                    free.put(slot)
+                    yield from (data[offset:offset + size] for offset in range(0, length * size, size))
+        finally:
+            stop.set()
+            free.put(None) # wake up task handler if blocked
+
     @staticmethod
-    def _worker_error(err: Exception):
+    def _encode_frames(frames: Iterable, stream: BinaryIO, queuesize: int):
+        """
+        Internal method: Writes frames to an encoder's input stream.
 
-        raise err
+        Writing happens on a dedicated thread, fed by a bounded queue,
+        so the encoder and the worker processes can make progress at the same time.
+        Exceptions raised by the writer thread are re-raised.
+
+        Args:
+            frames : Iterable of frames as raw RGB data (bytes-like objects), in order
+            stream : Input stream of encoder
+            queuesize : Maximum number of frames waiting to be written
+        """
+
+        pipeline = queue.Queue(maxsize = queuesize)
+        errors = []
+
+        def writer():
+            while True:
+                frame = pipeline.get()
+                if frame is None: # sentinel
+                    return
+                if len(errors) == 0: # after a failure, only drain the queue
+                    try:
+                        stream.write(frame)
+                        stream.flush()
+                    except Exception as e:
+                        errors.append(e)
+
+        thread = threading.Thread(target = writer, daemon = True)
+        thread.start()
+
+        try:
+            for frame in frames:
+                if len(errors) > 0:
+                    break
+                pipeline.put(frame)
+        finally:
+            pipeline.put(None)
+            thread.join()
+
+        if len(errors) > 0:
+            raise errors[0]
 
     @staticmethod
-    def _worker_init(video: VideoABC):
+    def _worker_init(worker: Union[Tuple, None], cores: Union[List[int], None], counter: Any):
+
+        global _worker
+        if worker is not None: # otherwise inherited via fork
+            _worker = worker
 
-        _workers[mp.current_process().name] = video
+        if cores is not None:
+            with counter.get_lock():
+                index = counter.value
+                counter.value += 1
+            os.sched_setaffinity(0, {cores[index % len(cores)]})
 
     @staticmethod
-    def _worker_render_frame(*args, **kwargs): # transparent wrapper for `render_frame`
+    def _worker_save_frame(frame, fn): # called per frame on writer thread, not type-checked, zlib releases the GIL
 
-        return _workers[mp.current_process().name].render_frame(*args, **kwargs)
+        frame.save(fn)
+        frame.close()
+
+    @staticmethod
+    def _worker_render_chunk(chunk: Tuple[int, int, int]) -> Tuple: # wrapper for `render_frame`
+
+        video, shared, stride, threads, frame_fn = _worker
+        start, length, slot = chunk
+
+        size = video._width * video._height * 3 # bytes per RGB frame
+        view = None if shared is None else memoryview(shared).cast('B')[slot * stride:slot * stride + length * size]
+
+        layers = None if threads == 1 else ThreadPoolExecutor(max_workers = threads) # renders layers of a frame
+        writer = None if frame_fn is None else ThreadPoolExecutor(max_workers = 2) # stores frames while rendering
+        pending = deque()
+
+        try:
+            for offset, time in enumerate(Time.range(video.time(start), video.time(start + length))): # times of chunk
+                frame = video._render_frame(
+                    time = time,
+                    buffer = None if view is None else view[offset * size:(offset + 1) * size], # frames rendered in place
+                    image = writer is not None,
+                    threads = layers,
+                )
+                if writer is None:
+                    continue
+                pending.append(writer.submit(video._worker_save_frame, frame, frame_fn.format(index = time.index)))
+                if len(pending) > 2: # bounds number of frames waiting to be stored
+                    pending.popleft().result()
+            while len(pending) > 0: # frames may share memory with slot, must be stored before returning
+                pending.popleft().result()
+        finally:
+            if layers is not None:
+                layers.shutdown()
+            if writer is not None:
+                writer.shutdown()
+
+        return start, length, slot
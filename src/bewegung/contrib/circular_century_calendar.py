@@ -29,15 +29,27 @@ specific language governing rights and limitations under the License.
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
 import calendar
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 import math
 from typing import List, Union
 
-from PIL.Image import Image, new, LANCZOS
+from PIL.Image import Image, alpha_composite, new, LANCZOS
 
 from ..lib import Color, typechecked
 from ..drawingboard import DrawingBoard
-from ..linalg import Matrix, Vector2D
+from ..linalg import Vector2D
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# ROUTINES
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+def _font(family: str, size: float) -> DrawingBoard.Pango.FontDescription:
+    return _font_cached(family, f'{size:.2f}') # same rounding as make_font
+
+@lru_cache(maxsize = 64)
+def _font_cached(family: str, size: str) -> DrawingBoard.Pango.FontDescription: # shared by all calendars, read-only
+    return DrawingBoard.make_font(family, float(size))
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 # CLASS
@@ -46,7 +58,7 @@ from ..linalg import Matrix, Vector2D
 @typechecked
 class _Background(DrawingBoard):
 
-    _twopi = 2 * math.pi
+    _twopi = math.tau
     _halfpi = math.pi / 2
 
     def draw_ticks(self,
@@ -62,16 +74,23 @@ class _Background(DrawingBoard):
         if length is None:
             length = len(ticks)
 
+        # Runs once per calendar (background is cached), for about 200 ticks in total.
+        # Plain math is sufficient here - a compiled kernel would not amortize its import and JIT cost.
+        # Major ticks coincide with every n-th minor tick, but sharing their 21 angles is not worth an extra API.
+
         af = self._twopi / length
+        lines = []
 
         for tick in ticks:
             angle = (tick - zero) * af - self._halfpi
-            self.draw_polygon(
-                Vector2D.from_polar(r1, angle),
-                Vector2D.from_polar(r2, angle),
-                line_color = line_color,
-                line_width = line_width,
-            )
+            cos, sin = math.cos(angle), math.sin(angle) # shared by both ends of tick
+            lines.append((Vector2D(r1 * cos, r1 * sin), Vector2D(r2 * cos, r2 * sin)))
+
+        self.draw_polygons(
+            *lines,
+            line_color = line_color,
+            line_width = line_width,
+        ) # stroked at once
 
     def draw_labels(self,
         r: float,
@@ -86,12 +105,13 @@ class _Background(DrawingBoard):
             length = len(labels)
 
         af = self._twopi / length
+        draw_text, from_polar = self.draw_text, Vector2D.from_polar # looked up once for all labels
 
         for idx, label in enumerate(labels):
             angle = (idx - zero) * af - self._halfpi
-            self.draw_text(
+            draw_text(
                 text = label,
-                point = Vector2D.from_polar(r, angle),
+                point = from_polar(r, angle),
                 font = font,
                 font_color = font_color,
             )
@@ -99,78 +119,82 @@ class _Background(DrawingBoard):
 @typechecked
 class _Foreground(DrawingBoard):
 
-    _twopi = 2 * math.pi
-    _days_in_decade = {}
+    _twopi = math.tau
+    _hands = (
+        ((-7.0, -98.0), (0.0, -118.0), (7.0, -98.0)), # decade in century
+        ((-7.0, -160.0), (0.0, -180.0), (7.0, -160.0)), # year in decade
+        ((0.0, -218.0),), # day in year
+    ) # unscaled vertices
 
-    def __init__(self, *args, **kwargs):
-
-        super().__init__(*args, **kwargs)
+    @classmethod
+    def scale_hands(cls, factor: float) -> tuple:
+        return tuple(
+            tuple((x * factor, y * factor) for x, y in hand)
+            for hand in cls._hands
+        )
 
-        self._days_in_decade.update({
-            decade: sum([
-                self._days_in_year(decade + year)
-                for year in range(10)
-            ])
-            for decade in range(1970, 2070 + 10, 10)
-        })
+    def draw_hands(self, dt: datetime, hands: tuple, color: Color):
 
-    def draw_hands(self, dt: datetime, factor: float, color: Color):
+        angle_year, angle_decade, angle_century = self._angles(dt)
+        hand_century, hand_decade, hand_year = hands # scaled via scale_hands
 
-        mr = Matrix.from_2d_rotation(self._angle_from_day_in_century(dt))
         self.draw_filledpolygon(
-            mr @ (Vector2D(-7.0, -98.0) * factor),
-            mr @ (Vector2D(0, -118.0) * factor),
-            mr @ (Vector2D(7.0, -98.0) * factor),
+            *self._rotate(angle_century, hand_century),
             fill_color = color,
         ) # decade in century
 
-        mr = Matrix.from_2d_rotation(self._angle_from_day_in_decade(dt))
         self.draw_filledpolygon(
-            mr @ (Vector2D(-7.0, -160.0) * factor),
-            mr @ (Vector2D(0, -180.0) * factor),
-            mr @ (Vector2D(7.0, -160.0) * factor),
+            *self._rotate(angle_decade, hand_decade),
             fill_color = color,
         ) # year in decade
 
-        mr = Matrix.from_2d_rotation(self._angle_from_day_in_year(dt))
         self.draw_filledcircle(
-            point = mr @ (Vector2D(0.0, -218.0) * factor),
+            point = self._rotate(angle_year, hand_year)[0],
             r = 8,
             fill_color = color,
         )
 
     @staticmethod
-    def _days_in_year(year: int) -> int:
-        return 366 if calendar.isleap(year) else 365
+    def _rotate(angle, points): # called per frame, not type-checked
+        sa, ca = math.sin(angle), math.cos(angle) # plain 2D rotation, computed once for all points
+        return [
+            Vector2D(ca * x - sa * y, sa * x + ca * y)
+            for x, y in points
+        ]
 
     @staticmethod
-    def _decade_from_year(year: int):
-        return int(year / 10) * 10
+    def _days_in_year(year): # called per frame, not type-checked
+        return 366 if calendar.isleap(year) else 365
 
     @staticmethod
-    def _day_in_year(dt: datetime):
-        return dt.timetuple().tm_yday
-
-    @classmethod
-    def _day_in_decade(cls, dt: datetime):
-        return sum([
-            cls._days_in_year(previous_year)
-            for previous_year in range(cls._decade_from_year(dt.year), dt.year)
-        ]) + cls._day_in_year(dt)
+    def _days_in_decade(decade): # called per frame, not type-checked
+        return 3650 + calendar.leapdays(decade, decade + 10) # constant time, no table required
 
-    @classmethod
-    def _angle_from_day_in_year(cls, dt: datetime) -> float:
-        return cls._twopi * cls._day_in_year(dt) / cls._days_in_year(dt.year)
+    @staticmethod
+    def _decade_from_year(year): # called per frame, not type-checked
+        return year // 10 * 10 # integer arithmetic, years are positive
 
-    @classmethod
-    def _angle_from_day_in_decade(cls, dt: datetime) -> float:
-        return cls._twopi * cls._day_in_decade(dt) / cls._days_in_decade[cls._decade_from_year(dt.year)]
+    @staticmethod
+    def _day_in_year(dt): # called per frame, not type-checked
+        return dt.toordinal() - date(dt.year, 1, 1).toordinal() + 1 # cheaper than building a struct_time
 
     @classmethod
-    def _angle_from_day_in_century(cls, dt: datetime) -> float:
-        fraction = cls._day_in_decade(dt) / cls._days_in_decade[cls._decade_from_year(dt.year)]
-        fraction += math.floor((dt.year - 2020) / 10)
-        return 10 * fraction * cls._twopi / 170
+    def _angles(cls, dt): # called per frame, not type-checked
+        """
+        Angles of all three hands: day in year, day in decade and day in century.
+        Day of year and day of decade are computed once and shared.
+        """
+
+        day_in_year = cls._day_in_year(dt)
+        decade = cls._decade_from_year(dt.year)
+        day_in_decade = 365 * (dt.year - decade) + calendar.leapdays(decade, dt.year) + day_in_year
+        days_in_decade = cls._days_in_decade(decade)
+
+        return (
+            cls._twopi * day_in_year / cls._days_in_year(dt.year),
+            cls._twopi * day_in_decade / days_in_decade,
+            10 * (day_in_decade / days_in_decade + math.floor((dt.year - 2020) / 10)) * cls._twopi / 170,
+        )
 
 @typechecked
 class CircularCenturyCalendar:
@@ -196,14 +220,31 @@ class CircularCenturyCalendar:
         self._center = Vector2D(self._side / 2, self._side / 2)
         self._factor = self._side / 450
 
-        self._font_years = DrawingBoard.make_font("Oxygen Mono", 20.0 * self._factor)
-        self._font_decades = DrawingBoard.make_font("Oxygen Mono", 10.0 * self._factor)
-        self._font_date = DrawingBoard.make_font("Oxygen Mono", 35.0 * self._factor)
+        self._font_years = _font("Oxygen Mono", 20.0 * self._factor)
+        self._font_decades = _font("Oxygen Mono", 10.0 * self._factor)
+        self._font_date = _font("Oxygen Mono", 35.0 * self._factor)
+
+        self._hands = _Foreground.scale_hands(self._factor) # constant for all frames
 
         self._background = self._draw_background()
+        self._base = alpha_composite(new(
+            'RGBA',
+            (self._side, self._side),
+            self._background_color.as_transparent().as_rgba_int(),
+        ), self._background) # static, composited once
+
+        self._cache = None # most recent day and its image
 
     def __call__(self, dt: datetime) -> Image:
 
+        day = dt.date()
+        if self._cache is None or self._cache[0] != day: # hands and date only change once per day
+            self._cache = (day, self._draw_day(dt))
+
+        return self._cache[1].copy() # callers may modify their image
+
+    def _draw_day(self, dt: datetime) -> Image:
+
         foreground = _Foreground(
             width = self._side,
             height = self._side,
@@ -220,19 +261,13 @@ class CircularCenturyCalendar:
 
         foreground.draw_hands(
             dt = dt,
-            factor = self._factor,
+            hands = self._hands,
             color = self._foreground_color,
         )
 
         foreground = foreground.as_pil()
 
-        image = new(
-            'RGBA',
-            (self._side, self._side),
-            self._background_color.as_transparent().as_rgba_int(),
-        ) # transparent black
-        image.paste(im = self._background, mask = self._background)
-        image.paste(im = foreground, mask = foreground)
+        image = alpha_composite(self._base, foreground) # new image, base is not touched
 
         return image.resize(
             (self._actual_side, self._actual_side),
@@ -28,11 +28,12 @@ specific language governing rights and limitations under the License.
 # IMPORT
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
-from functools import wraps
+from functools import lru_cache, wraps
 import io
 import math
 import os
-from typing import Callable, Union
+from threading import get_ident
+from typing import Callable, Sequence, Union
 
 import cairo
 from PIL import Image
@@ -50,6 +51,8 @@ except Exception as e:
                 LEFT, CENTER, RIGHT = None, None, None
             class FontDescription:
                 pass
+            class Layout:
+                pass
         PangoCairo = None
         class Rsvg:
             class Handle:
@@ -63,6 +66,7 @@ except ModuleNotFoundError:
     IPython = None
 
 from ..lib import Color, typechecked
+from ..lib._argb32 import argb32_to_pil
 from ..linalg import Vector2D, Matrix
 from ._abc import DrawingBoardABC
 
@@ -74,13 +78,30 @@ from ._abc import DrawingBoardABC
 def _geometry(func: Callable) -> Callable:
     @wraps(func)
     def wrapper(self, *args, **kwargs):
-        self.ctx.save()
-        self.ctx.new_path()
+        ctx = self._ctx # bypasses type-checked property
+        ctx.save()
+        ctx.new_path()
         ret = func(self, *args, **kwargs)
-        self.ctx.restore()
+        ctx.restore()
         return ret
     return wrapper
 
+@lru_cache(maxsize = 128)
+def _svg_from_file(fn: str, mtime: int, thread: int) -> Rsvg.Handle: # keyed by modification time and thread
+    return Rsvg.Handle.new_from_file(fn)
+
+@lru_cache(maxsize = 128)
+def _svg_from_data(raw: bytes, thread: int) -> Rsvg.Handle: # keyed by thread, handles are not thread-safe
+    return Rsvg.Handle.new_from_data(raw)
+
+@lru_cache(maxsize = 128)
+def _text_layout(text: str, font: str, alignment: str, thread: int) -> Pango.Layout: # keyed by thread, layouts are mutable
+    layout = Pango.Layout.new(PangoCairo.FontMap.get_default().create_context()) # bound to cairo context on every use
+    layout.set_font_description(Pango.font_description_from_string(font))
+    layout.set_alignment(DrawingBoard._alignment[alignment])
+    layout.set_markup(text, -1)
+    return layout
+
 @typechecked
 class DrawingBoard(DrawingBoardABC):
     """
@@ -92,7 +113,8 @@ class DrawingBoard(DrawingBoardABC):
         width : Canvas width in pixels
         height : Canvas width in pixels
         offset : Center of coordinate system (device offset)
-        subpixels : Number of subpixels per pixel (devise scale)
+        subpixels : Number of subpixels per pixel (devise scale).
+            Memory and export time grow with its square, cairo's own anti-aliasing is usually sufficient.
         background_color : Canvas background color - transparent white by default
     """
 
@@ -101,6 +123,10 @@ class DrawingBoard(DrawingBoardABC):
     PangoCairo = PangoCairo
     Rsvg = Rsvg
 
+    _opaque_black = Color(0, 0, 0, 255) # default color of lines, fills and text, immutable
+    _transparent_white = Color(255, 255, 255, 0) # default background color, immutable
+    _origin = Vector2D(0.0, 0.0) # default point and offset, only ever read
+
     def __init__(self,
         width: int,
         height: int,
@@ -117,9 +143,9 @@ class DrawingBoard(DrawingBoardABC):
             raise ValueError('there must be a positive number subpixels')
 
         if offset is None:
-            offset = Vector2D(0.0, 0.0)
+            offset = self._origin
         if background_color is None:
-            background_color = Color(255, 255, 255, 0) # transparent white
+            background_color = self._transparent_white
 
         self._width, self._height, self._subpixels, self._offset = width, height, subpixels, offset
 
@@ -129,7 +155,7 @@ class DrawingBoard(DrawingBoardABC):
             self._height * self._subpixels,
             )
 
-        if self._offset != Vector2D(0.0, 0.0):
+        if self._offset != self._origin:
             self._surface.set_device_offset(self._offset.x * self._subpixels, self._offset.y * self._subpixels)
 
         if self._subpixels != 1:
@@ -142,29 +168,31 @@ class DrawingBoard(DrawingBoardABC):
 
         return f'<DrawingBoard width={self._width:d} height={self._height:d} subpixels={self._subpixels:d}>'
 
-    def as_pil(self) -> Image.Image:
+    def as_pil(self, resample: int = Image.LANCZOS) -> Image.Image:
         """
         Exports drawing as a Pillow Image object
+
+        Args:
+            resample : Pillow resampling filter for downsampling drawings with more than one subpixel per pixel.
+                ``Image.BOX`` and ``Image.BILINEAR`` are considerably faster than the default, ``Image.LANCZOS``.
         """
 
+        image = argb32_to_pil(self._surface)
+
         if self._subpixels == 1:
-            return self.swap_channels(Image.frombuffer(
-                mode = 'RGBa',
-                size = (self._width, self._height),
-                data = self._surface.get_data().tobytes(), # call to "tobytes" required because of RGBa mode
-                )).convert("RGBA")
-
-        return self.swap_channels(Image.frombuffer(
-            mode = 'RGBa',
-            size = (self._width * self._subpixels, self._height * self._subpixels),
-            data = self._surface.get_data().tobytes(), # call to "tobytes" required because of RGBa mode
-            ).convert("RGBA").resize(
-                (self._width, self._height),
-                resample = Image.LANCZOS,
-            ))
+            return image
+
+        return image.resize(
+            (self._width, self._height),
+            resample = resample,
+        )
 
     @staticmethod
     def swap_channels(image: Image.Image) -> Image.Image:
+        """
+        Swaps red and blue channels of an RGBA image.
+        Deprecated, no longer required for exporting drawings.
+        """
 
         b, g, r, a = image.split()
         return Image.merge(image.mode, (r, g, b, a))
@@ -178,31 +206,35 @@ class DrawingBoard(DrawingBoardABC):
             raise NotImplementedError('IPython is not available')
 
         with io.BytesIO() as buffer:
-            self.as_pil().save(buffer, format = 'PNG')
-            image_bytes = buffer.getvalue()
+            self.as_pil().save(buffer, format = 'PNG', compress_level = 1) # fast, image is only displayed once
+            image_bytes = buffer.getvalue() # hands over internal buffer without copying it
 
         IPython.display.display(
             IPython.display.Image(data = image_bytes, format = 'png')
             )
 
-    def save(self, fn: str):
+    def save(self, fn: str, compress_level: int = 6):
         """
         Saves drawing to a file
 
         Args:
             fn : Path to image file. The image format is derived from the file extension.
+            compress_level : zlib compression level 0...9 for PNG files, ignored by other formats.
+                Lower levels are considerably faster at the expense of larger files.
         """
 
         if len(fn) == 0:
             raise ValueError('filename must not be empty')
+        if not (0 <= compress_level <= 9):
+            raise ValueError('compress_level out of bounds (0...9)')
 
-        self.as_pil().save(fn)
+        self.as_pil().save(fn, compress_level = compress_level)
 
     @_geometry
     def draw_svg(self,
         fn: Union[str, None] = None,
         raw: Union[bytes, None] = None,
-        svg: Union[Rsvg.Handle, None] = None,
+        svg: Union[Rsvg.Handle, cairo.RecordingSurface, None] = None,
         point: Union[Vector2D, None] = None,
         scale: float = 1.0,
         angle: float = 0.0,
@@ -215,12 +247,12 @@ class DrawingBoard(DrawingBoardABC):
 
         (1) a path/filename, from where the SVG can be loaded
         (2) a raw sequence of bytes containing the SVG markup
-        (3) a handle on an rsvg object
+        (3) a handle on an rsvg object or a recording of it, see :meth:`bewegung.DrawingBoard.make_svg_recording`
 
         Args:
             fn : Path to SVG file (1)
             raw : SVG markup (2)
-            svg : rsvg handle object (3)
+            svg : rsvg handle object or cairo recording surface (3)
             point : Location of the SVG within the drawing relative to the SVG's anchor
             scale : Allows to resize the SVG by the provided factor
             angle : Rotates the SVG by a given angle in radians
@@ -230,45 +262,51 @@ class DrawingBoard(DrawingBoardABC):
                 Second letters can be "l" (left), "c" (center) and "r" (right).
         """
 
-        if not ((fn is not None) ^ (raw is not None) ^ (svg is not None)):
+        if (fn is not None) + (raw is not None) + (svg is not None) != 1: # xor would accept all three
             raise RuntimeError('SVG must be provided exactly once')
 
         if svg is None:
             if raw is None:
                 if len(fn) == 0:
                     raise ValueError('filename must not be empty')
-                svg = Rsvg.Handle.new_from_file(fn)
+                svg = _svg_from_file(fn, os.stat(fn).st_mtime_ns, get_ident()) # parsed once unless modified
             else:
-                svg = Rsvg.Handle.new_from_data(raw)
+                svg = _svg_from_data(raw, get_ident()) # parsed once
 
         if point is None:
-            point = Vector2D(0.0, 0.0)
-        scale = Vector2D(scale, scale)
+            point = self._origin
 
-        svg_dim = svg.get_dimensions()
-        svg_dim = Vector2D(svg_dim.width, svg_dim.height)
+        if isinstance(svg, cairo.RecordingSurface):
+            svg_dim = svg.get_extents() # x and y are zero, see make_svg_recording
+        else:
+            svg_dim = svg.get_dimensions()
 
         if isinstance(anchor, str):
             try:
-                anchor = self._anchor[anchor]
+                kx, ky = self._anchor[anchor]
             except KeyError:
                 raise ValueError('unknown anchor point')
-            anchor = anchor(*svg_dim.as_tuple())
+            anchor = Vector2D(kx * svg_dim.width, ky * svg_dim.height)
         else:
             anchor = anchor * -1.0
 
         self._ctx.translate(
-            point.x + anchor.x * scale.x,
-            point.y + anchor.y * scale.y,
+            point.x + anchor.x * scale,
+            point.y + anchor.y * scale,
         )
-        self._ctx.scale(*scale.as_tuple())
-        self._ctx.rotate(angle)
-
-        anchor = anchor * -1.0
-        shift = Matrix.from_2d_rotation(-angle) @ anchor - anchor
-        self._ctx.translate(*shift.as_tuple())
+        if scale != 1.0: # identity otherwise
+            self._ctx.scale(scale, scale)
+        if angle != 0.0: # identity otherwise, no shift either
+            self._ctx.rotate(angle)
+            anchor = anchor * -1.0
+            shift = Matrix.from_2d_rotation(-angle) @ anchor - anchor
+            self._ctx.translate(*shift.as_tuple())
 
-        svg.render_cairo(self._ctx)
+        if isinstance(svg, cairo.RecordingSurface):
+            self._ctx.set_source_surface(svg, 0, 0)
+            self._ctx.paint() # replays recorded drawing operations, SVG is not interpreted again
+        else:
+            svg.render_cairo(self._ctx)
 
     @staticmethod
     def make_svg(
@@ -288,7 +326,7 @@ class DrawingBoard(DrawingBoardABC):
             raw : SVG markup (2)
         """
 
-        if not ((fn is not None) ^ (raw is not None)):
+        if (fn is not None) + (raw is not None) != 1:
             raise RuntimeError('SVG must be provided exactly once')
 
         if raw is not None:
@@ -298,6 +336,27 @@ class DrawingBoard(DrawingBoardABC):
             raise ValueError('filename must not be empty')
         return Rsvg.Handle.new_from_file(fn)
 
+    @staticmethod
+    def make_svg_recording(svg: Rsvg.Handle) -> cairo.RecordingSurface:
+        """
+        Records the drawing operations of an rsvg handle for re-use.
+        Drawing the recording is considerably faster than drawing the handle itself,
+        because the SVG does not have to be interpreted again.
+
+        Args:
+            svg : rsvg handle object, see :meth:`bewegung.DrawingBoard.make_svg`
+        """
+
+        svg_dim = svg.get_dimensions()
+
+        recording = cairo.RecordingSurface(
+            cairo.CONTENT_COLOR_ALPHA,
+            cairo.Rectangle(0, 0, svg_dim.width, svg_dim.height),
+        )
+        svg.render_cairo(cairo.Context(recording))
+
+        return recording
+
     @_geometry
     def draw_text(self,
         text: str = '',
@@ -315,7 +374,7 @@ class DrawingBoard(DrawingBoardABC):
             text : The actual text. Can handle explicit line breaks (``\\n``) but does not offer automatic line breaks.
             point : Location of the text within the drawing relative to the text's anchor
             angle : Rotates the text by a given angle in radians
-            font : A Pango font description object
+            font : A Pango font description object. Arial, 10 points by default.
             font_color : The font color. Opaque black by default.
             alignment : Single letter describing the text allignment. Can be "l" (left), "c" (center) and "r" (right).
             anchor : Describes the achor point of the text.
@@ -325,30 +384,29 @@ class DrawingBoard(DrawingBoardABC):
         """
 
         if point is None:
-            point = Vector2D(0.0, 0.0)
-        if font is None:
-            font = self.make_font('Arial', 10.0)
+            point = self._origin
         if font_color is None:
-            font_color = Color(0, 0, 0, 255) # opaque black
+            font_color = self._opaque_black
 
-        layout = PangoCairo.create_layout(self._ctx)
-        layout.set_font_description(font)
-        try:
-            alignment = self._alignment[alignment]
-        except KeyError:
+        if alignment not in self._alignment.keys():
             raise ValueError('unknown alignment')
-        layout.set_alignment(alignment)
-        layout.set_markup(text, -1)
+        layout = _text_layout(
+            text,
+            self._font_default if font is None else font.to_string(),
+            alignment,
+            get_ident(),
+        ) # laid out once per font and alignment
+        PangoCairo.update_layout(self._ctx, layout) # adopt transformation and font options of this drawing
 
         self._ctx.set_source_rgba(*font_color.as_rgba_float())
 
         if isinstance(anchor, str):
             _, text_extents = layout.get_pixel_extents()
             try:
-                anchor = self._anchor[anchor]
+                kx, ky = self._anchor[anchor]
             except KeyError:
                 raise ValueError('unknown anchor point')
-            anchor = anchor(text_extents.width, text_extents.height)
+            anchor = Vector2D(kx * text_extents.width, ky * text_extents.height)
         else:
             anchor = anchor * -1
 
@@ -361,22 +419,24 @@ class DrawingBoard(DrawingBoardABC):
         PangoCairo.show_layout(self._ctx, layout)
 
     _anchor = {
-        'tl': lambda width, height: Vector2D(0.0, 0.0), # top left
-        'tc': lambda width, height: Vector2D(-width / 2, 0.0), # top center
-        'tr': lambda width, height: Vector2D(float(-width), 0.0), # top right
-        'cl': lambda width, height: Vector2D(0.0, -height / 2), # center left
-        'cc': lambda width, height: Vector2D(-width / 2, -height / 2), # center center
-        'cr': lambda width, height: Vector2D(float(-width), -height / 2), # center right
-        'bl': lambda width, height: Vector2D(0.0, float(-height)), # bottom left
-        'bc': lambda width, height: Vector2D(-width / 2, float(-height)), # bottom center
-        'br': lambda width, height: Vector2D(float(-width), float(-height)), # bottom right
-    }
+        'tl': (0.0, 0.0), # top left
+        'tc': (-0.5, 0.0), # top center
+        'tr': (-1.0, 0.0), # top right
+        'cl': (0.0, -0.5), # center left
+        'cc': (-0.5, -0.5), # center center
+        'cr': (-1.0, -0.5), # center right
+        'bl': (0.0, -1.0), # bottom left
+        'bc': (-0.5, -1.0), # bottom center
+        'br': (-1.0, -1.0), # bottom right
+    } # factors for width and height
     _alignment = {
         'l': Pango.Alignment.LEFT,
         'c': Pango.Alignment.CENTER,
         'r': Pango.Alignment.RIGHT,
     }
 
+    _font_default = 'Arial 10.00' # description of default font, as generated by make_font
+
     @staticmethod
     def make_font(family: str, size: float) -> Pango.FontDescription:
         """
@@ -408,11 +468,31 @@ class DrawingBoard(DrawingBoardABC):
         if len(points) < 2:
             raise ValueError('at least two points most be provided')
 
-        self._ctx.move_to(points[0].x, points[0].y)
-        for point in points[1:]:
-            self._ctx.line_to(point.x, point.y)
-        if close:
-            self._ctx.line_to(points[0].x, points[0].y)
+        self._trace(points, close)
+        self._stroke(**kwargs)
+
+    @_geometry
+    def draw_polygons(self,
+        *polygons: Sequence[Vector2D],
+        close: bool = False,
+        **kwargs,
+        ):
+        """
+        Adds multiple unfilled polygons sharing one line style to the drawing.
+        All polygons are stroked at once, which is faster than individual calls of ``draw_polygon``.
+        Where semi-transparent lines overlap, they are not blended with each other.
+
+        Args:
+            polygons : An arbitrary number of sequences of 2D vectors
+            close : Whether or not the polygons should be closed
+            kwargs : Arguments for line stroke (see ``_stroke``)
+        """
+
+        if any(len(points) < 2 for points in polygons):
+            raise ValueError('at least two points must be provided per polygon')
+
+        for points in polygons:
+            self._trace(points, close) # move_to starts a new sub-path
         self._stroke(**kwargs)
 
     @_geometry
@@ -431,11 +511,9 @@ class DrawingBoard(DrawingBoardABC):
         if len(points) < 3:
             raise ValueError('at least three points most be provided')
         if fill_color is None:
-            fill_color = Color(0, 0, 0, 255) # opaque black
+            fill_color = self._opaque_black
 
-        self._ctx.move_to(points[0].x, points[0].y)
-        for point in points[1:]:
-            self._ctx.line_to(point.x, point.y)
+        self._trace(points)
         self._ctx.set_source_rgba(*fill_color.as_rgba_float())
         self._ctx.fill()
 
@@ -505,7 +583,7 @@ class DrawingBoard(DrawingBoardABC):
             raise ValueError('radius must be greater or equal to zero')
 
         if fill_color is None:
-            fill_color = Color(0, 0, 0, 255) # opaque black
+            fill_color = self._opaque_black
 
         self._ctx.arc(
             point.x, point.y, r,
@@ -514,6 +592,23 @@ class DrawingBoard(DrawingBoardABC):
         self._ctx.set_source_rgba(*fill_color.as_rgba_float())
         self._ctx.fill()
 
+    def _trace(self, points, close = False): # points are type-checked by callers
+        """
+        Traces a path along points. Never called directly.
+
+        Args:
+            points : A tuple of 2D vectors
+            close : Whether or not the path should return to its first point
+        """
+
+        line_to = self._ctx.line_to # looked up once for all points
+
+        self._ctx.move_to(*points[0].as_tuple())
+        for point in points[1:]:
+            line_to(*point.as_tuple())
+        if close:
+            line_to(*points[0].as_tuple())
+
     def _stroke(self,
         line_color: Union[Color, None] = None,
         line_width: float = 1.0,
@@ -528,7 +623,7 @@ class DrawingBoard(DrawingBoardABC):
         """
 
         if line_color is None:
-            line_color = Color(0, 0, 0, 255) # opaque black
+            line_color = self._opaque_black
 
         self._ctx.set_source_rgba(*line_color.as_rgba_float())
         self._ctx.set_line_width(line_width)
@@ -539,11 +634,16 @@ class DrawingBoard(DrawingBoardABC):
         ):
 
         if fill_color is None:
-            fill_color = Color(255, 255, 255, 0) # transparent white
+            fill_color = self._transparent_white
+
+        if fill_color.a == 0: # new surfaces are already fully transparent
+            return
 
+        self._ctx.save()
+        self._ctx.set_operator(cairo.OPERATOR_SOURCE) # no blending, surface is blank
         self._ctx.set_source_rgba(*fill_color.as_rgba_float())
-        self._ctx.rectangle(0, 0, self._width, self._height)
-        self._ctx.fill()
+        self._ctx.paint() # entire surface, regardless of device offset
+        self._ctx.restore()
 
     @property
     def ctx(self) -> cairo.Context:
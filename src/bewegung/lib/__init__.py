@@ -30,3 +30,13 @@ specific language governing rights and limitations under the License.
 
 from ._color import Color
 from ._typeguard import typechecked
+
+try:
+    import numpy as _np
+except ModuleNotFoundError:
+    _np = None
+
+if _np is not None:
+    from ._colorarray import ColorArray
+
+del _np
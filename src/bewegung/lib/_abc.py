@@ -35,4 +35,7 @@ from abc import ABC
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
 class ColorABC(ABC):
+    __slots__ = ()
+
+class ColorArrayABC(ABC):
     pass
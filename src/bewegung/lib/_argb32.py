@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+"""
+
+BEWEGUNG
+a versatile video renderer
+https://github.com/pleiszenburg/bewegung
+
+    src/bewegung/lib/_argb32.py: Conversion of cairo ARGB32 surfaces
+
+    Copyright (C) 2020-2022 Sebastian M. Ernst <ernst@pleiszenburg.de>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to the GNU Lesser General Public License
+Version 2.1 ("LGPL" or "License"). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/old-licenses/lgpl-2.1.txt
+https://github.com/pleiszenburg/bewegung/blob/master/LICENSE
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPORT
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import sys
+from typing import Any
+
+from PIL.Image import Image, frombuffer
+
+from ._typeguard import typechecked
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# ROUTINES
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+@typechecked
+def argb32_to_pil(surface: Any) -> Image:
+    """
+    Converts a cairo image surface in ``ARGB32`` format to a Pillow Image object in ``RGBA`` mode.
+    The surface's data is decoded in a single pass, without intermediate copies.
+
+    Args:
+        surface : A cairo image surface
+    """
+
+    size = (surface.get_width(), surface.get_height())
+
+    if sys.byteorder == 'little':
+        return frombuffer(
+            'RGBA', size, surface.get_data(),
+            'raw', 'BGRa', surface.get_stride(), 1,
+        ) # premultiplied BGRA in memory
+
+    return frombuffer(
+        'RGBa', size, surface.get_data(),
+        'raw', 'aRGB', surface.get_stride(), 1,
+    ).convert('RGBA') # premultiplied ARGB in memory, no raw mode for un-premultiplying it directly
@@ -52,6 +52,8 @@ class Color(ColorABC):
         a : alpha channel 0...255 (uint8), opaque by default
     """
 
+    __slots__ = ('_r', '_g', '_b', '_a', '_rgba_float') # no per-instance dict, many colors are small
+
     def __init__(self,
         r: int,
         g: int,
@@ -69,6 +71,7 @@ class Color(ColorABC):
             raise ValueError('alpha color channel out of bounds (0...255)')
 
         self._r, self._g, self._b, self._a = r, g, b, a
+        self._rgba_float = (r / 255, g / 255, b / 255, a / 255) # immutable, computed once for all draw calls
 
     def __repr__(self) -> str:
 
@@ -124,7 +127,7 @@ class Color(ColorABC):
         Exports color a tuple of floats 0.0...1.0
         """
 
-        return self._r / 255, self._g / 255, self._b / 255, self._a / 255
+        return self._rgba_float
 
     def as_rgba_int(self) -> Tuple[int, int, int, int]:
         """
@@ -194,14 +197,7 @@ class Color(ColorABC):
 
         assert len(raw) in (6, 8)
 
-        return cls(**{
-            color: int(component, base = 16)
-            for color, component in zip(
-                ('r', 'g', 'b', 'a'),
-                (raw[idx:idx+2] for idx in range(0, 8, 2)),
-            )
-            if not (color == 'a' and len(component) == 0)
-        })
+        return cls(*bytes.fromhex(raw)) # r, g, b and optionally a, decoded in one pass
 
     @classmethod
     def from_hsv(cls,
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+
+"""
+
+BEWEGUNG
+a versatile video renderer
+https://github.com/pleiszenburg/bewegung
+
+    src/bewegung/lib/_colorarray.py: Arrays of colors
+
+    Copyright (C) 2020-2022 Sebastian M. Ernst <ernst@pleiszenburg.de>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to the GNU Lesser General Public License
+Version 2.1 ("LGPL" or "License"). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/old-licenses/lgpl-2.1.txt
+https://github.com/pleiszenburg/bewegung/blob/master/LICENSE
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPORT
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+from numbers import Integral
+from typing import Iterable, List, Union
+
+import numpy as np
+
+from ._abc import ColorABC, ColorArrayABC
+from ._color import Color
+from ._typeguard import typechecked
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# CLASS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+@typechecked
+class ColorArray(ColorArrayABC):
+    """
+    An array of RGBA colors, e.g. a palette or gradient, stored in a single ``numpy`` array.
+
+    Requires ``numpy``. Mutable.
+
+    Args:
+        rgba : ``uint8`` array of shape ``(length, 4)``, holding red, green, blue and alpha channels 0...255
+    """
+
+    def __init__(self, rgba: np.ndarray):
+
+        if rgba.ndim != 2 or rgba.shape[1] != 4:
+            raise ValueError('inconsistent: rgba.shape != (length, 4)')
+        if rgba.dtype != np.uint8:
+            raise TypeError('rgba.dtype must be uint8')
+
+        self._rgba = rgba
+
+    def __repr__(self) -> str:
+        """
+        String representation for interactive use
+        """
+
+        return f'<ColorArray len={len(self):d}>'
+
+    def __len__(self) -> int:
+        """
+        Length of array
+        """
+
+        return self._rgba.shape[0]
+
+    def __getitem__(self, idx: Union[Integral, slice]) -> Union[ColorABC, ColorArrayABC]:
+        """
+        Item access, returning an independent object - either
+        a :class:`bewegung.Color` (index access) or
+        a :class:`bewegung.ColorArray` (slicing)
+
+        Args:
+            idx : Either an index (including ``numpy`` integers) or a slice
+        """
+
+        if isinstance(idx, Integral):
+            return Color(*(int(channel) for channel in self._rgba[idx]))
+
+        return type(self)(self._rgba[idx].copy())
+
+    def as_list(self) -> List[ColorABC]:
+        """
+        Exports a list of :class:`bewegung.Color` objects
+        """
+
+        return [Color(*channels) for channels in self._rgba.tolist()]
+
+    def as_rgba_float(self, dtype: str = 'f8') -> np.ndarray:
+        """
+        Exports colors as a new array of floats 0.0...1.0 of shape ``(length, 4)``
+
+        Args:
+            dtype : Desired ``numpy`` data type of exported array
+        """
+
+        return np.divide(self._rgba, 255, dtype = dtype)
+
+    def as_rgba_int(self, copy: bool = True) -> np.ndarray:
+        """
+        Exports colors as an array of ints 0...255 (uint8) of shape ``(length, 4)``
+
+        Args:
+            copy : Provide a copy of underlying array
+        """
+
+        return self._rgba.copy() if copy else self._rgba
+
+    @classmethod
+    def from_iterable(cls, obj: Iterable[ColorABC]) -> ColorArrayABC:
+        """
+        Generates color array object from an iterable of :class:`bewegung.Color` objects
+
+        Args:
+            obj : iterable
+        """
+
+        if not isinstance(obj, list):
+            obj = list(obj)
+
+        return cls(np.array(
+            [color.as_rgba_int() for color in obj],
+            dtype = np.uint8,
+        ).reshape(len(obj), 4)) # shape also holds for empty iterables
+
+    @classmethod
+    def from_hsv(cls, h: np.ndarray, s: np.ndarray, v: np.ndarray) -> ColorArrayABC:
+        """
+        Generates opaque color array object from arrays of HSV components,
+        equivalent to :meth:`bewegung.Color.from_hsv` for every color.
+        Components are one-dimensional arrays of equal length, zero-dimensional arrays are treated as arrays of length one.
+
+        Args:
+            h : hue 0.0...360.0
+            s : saturation 0.0...1.0
+            v : value (brightness) 0.0...1.0
+        """
+
+        h, s, v = np.atleast_1d(h, s, v)
+
+        if h.ndim != 1 or s.ndim != 1 or v.ndim != 1:
+            raise ValueError('inconsistent: ndim != 1')
+        if not h.shape[0] == s.shape[0] == v.shape[0]:
+            raise ValueError('inconsistent length')
+
+        if not np.all((h >= 0.0) & (h <= 360.0)):
+            raise ValueError('hue value out of bounds (0.0...360.0)')
+        if not np.all((s >= 0.0) & (s <= 1.0)):
+            raise ValueError('saturation value out of bounds (0.0...1.0)')
+        if not np.all((v >= 0.0) & (v <= 1.0)):
+            raise ValueError('"value" (brightness) value out of bounds (0.0...1.0)')
+
+        hi = np.floor(h / 60)
+        f = h / 60 - hi
+
+        components = np.stack((
+            np.round(255 * v),
+            np.round(255 * v * (1 - s * (1 - f))),
+            np.round(255 * v * (1 - s)),
+            np.round(255 * v * (1 - s * f)),
+        )).astype(np.uint8) # v, t, p, q
+
+        rgba = np.full((components.shape[1], 4), 255, dtype = np.uint8) # opaque
+        rgba[:, :3] = np.take_along_axis(
+            components,
+            cls._hsv_sectors[hi.astype(np.intp)].T,
+            axis = 0,
+        ).T # selects r, g and b from components per sector of hue, without branches
+
+        return cls(rgba)
+
+    _hsv_sectors = np.array([
+        (0, 1, 2), # v, t, p
+        (3, 0, 2), # q, v, p
+        (2, 0, 1), # p, v, t
+        (2, 3, 0), # p, q, v
+        (1, 2, 0), # t, p, v
+        (0, 2, 3), # v, p, q
+        (0, 1, 2), # v, t, p (hue of 360.0)
+    ], dtype = np.intp) # indices into components per sector of hue
@@ -28,7 +28,12 @@ specific language governing rights and limitations under the License.
 # IMPORT
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
+import os
+
 try:
     from typeguard import typechecked
 except ModuleNotFoundError:
     typechecked = lambda x: x
+
+if os.environ.get('BEWEGUNG_TYPECHECK', '1') == '0': # opt-out, evaluated once on import
+    typechecked = lambda x: x
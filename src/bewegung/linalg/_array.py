@@ -55,14 +55,17 @@ class VectorArray(ABC, Iterable):
     @abstractmethod
     def __init__(self, meta: Union[MetaArrayDict, None] = None):
 
-        meta = {} if meta is None else dict(meta)
+        if not meta: # common case: no meta data, nothing to copy or validate
+            self._meta = {}
+            return
 
         if not all(value.ndim == 1 for value in meta.values()):
             raise ValueError('inconsistent: meta_value.ndim != 1')
-        if not all(value.shape[0] == len(self) for value in meta.values()):
+        length = len(self)
+        if not all(value.shape[0] == length for value in meta.values()):
             raise ValueError('inconsistent length')
 
-        self._meta = meta
+        self._meta = dict(meta)
 
     @property
     def meta(self) -> MetaArrayDict:
@@ -29,7 +29,7 @@ specific language governing rights and limitations under the License.
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
 from numbers import Number
-from typing import Any, List, Tuple, Union
+from typing import Any, Iterator, List, Tuple, Union
 
 from ..lib import typechecked
 from ._abc import (
@@ -41,6 +41,7 @@ from ._abc import (
 )
 from ._array import VectorArray
 from ._const import FLOAT_DEFAULT
+from ._kernels import mag2_jit
 from ._lib import dtype_np2py, dtype_name
 from ._numpy import np
 from ._single2d import Vector2D
@@ -107,13 +108,7 @@ class VectorArray2D(VectorArray, VectorArray2DABC):
         """
 
         if isinstance(idx, int):
-            dtype = dtype_np2py(self.dtype)
-            return Vector2D(
-                x = dtype(self._x[idx]),
-                y = dtype(self._y[idx]),
-                dtype = dtype,
-                meta = {key: value[idx] for key, value in self._meta.items()},
-            )
+            return self._item(idx, dtype_np2py(self.dtype))
 
         return VectorArray2D(
             x = self._x[idx].copy(),
@@ -121,24 +116,39 @@ class VectorArray2D(VectorArray, VectorArray2DABC):
             meta = {key: value[idx].copy() for key, value in self._meta.items()},
         )
 
-    def __iter__(self) -> VectorArray2DABC:
+    def _item(self, idx, dtype): # called per element, not type-checked
+        return Vector2D(
+            x = dtype(self._x[idx]),
+            y = dtype(self._y[idx]),
+            dtype = dtype,
+            meta = {key: value[idx] for key, value in self._meta.items()},
+        )
+
+    def __iter__(self) -> Iterator[Vector2D]:
         """
-        Iterator interface (1/2)
+        Iterator interface, returning an independent iterator.
+        Nested and concurrent iterations over the same array do not interfere.
         """
 
-        self._iterstate = 0
-        return self
+        return self._iter_items()
+
+    def _iter_items(self): # generator, not type-checked
+        dtype = dtype_np2py(self.dtype) # once per iteration
+        for idx in range(len(self)):
+            yield self._item(idx, dtype)
 
     def __next__(self) -> Vector2D:
         """
-        Iterator interface (2/2)
+        Stateful iteration via ``next``, independent of ``__iter__``
         """
 
         if self._iterstate == len(self):
             self._iterstate = 0 # reset
             raise StopIteration()
+        if self._iterstate == 0:
+            self._iterdtype = dtype_np2py(self.dtype) # once per iteration
 
-        value = self[self._iterstate]
+        value = self._item(self._iterstate, self._iterdtype)
         self._iterstate += 1 # increment
         return value
 
@@ -153,7 +163,7 @@ class VectorArray2D(VectorArray, VectorArray2DABC):
         if not isinstance(other, VectorArray2DABC):
             return NotImplemented
 
-        return np.array_equal(self.x, other.x) and np.array_equal(self.y, other.y)
+        return np.array_equal(self._x, other.x) and np.array_equal(self._y, other.y)
 
     def __mod__(self, other: Any) -> Union[bool, NotImplementedType]:
         """
@@ -166,7 +176,7 @@ class VectorArray2D(VectorArray, VectorArray2DABC):
         if not isinstance(other, VectorArray2DABC):
             return NotImplemented
 
-        return np.allclose(self.x, other.x) and np.allclose(self.y, other.y)
+        return np.allclose(self._x, other.x) and np.allclose(self._y, other.y)
 
     def __add__(self, other: Any) -> Union[VectorArray2DABC, NotImplementedType]:
         """
@@ -176,16 +186,16 @@ class VectorArray2D(VectorArray, VectorArray2DABC):
             other : Another vector array of equal length
         """
 
-        if not any(isinstance(other, t) for t in (VectorArray2DABC, Vector2D)):
+        if not isinstance(other, (VectorArray2DABC, Vector2D)):
             return NotImplemented
 
         if isinstance(other, VectorArray2DABC):
-            if len(self) != len(other):
+            if len(self._x) != len(other):
                 raise ValueError('inconsistent length')
-            if self.dtype != other.dtype:
+            if self._x.dtype != other.dtype:
                 raise TypeError('inconsistent dtype')
 
-        return VectorArray2D(self.x + other.x, self.y + other.y)
+        return VectorArray2D(self._x + other.x, self._y + other.y)
 
     def __radd__(self, *args, **kwargs):
 
@@ -199,16 +209,16 @@ class VectorArray2D(VectorArray, VectorArray2DABC):
             other : Another vector array of equal length
         """
 
-        if not any(isinstance(other, t) for t in (VectorArray2DABC, Vector2D)):
+        if not isinstance(other, (VectorArray2DABC, Vector2D)):
             return NotImplemented
 
         if isinstance(other, VectorArray2DABC):
-            if len(self) != len(other):
+            if len(self._x) != len(other):
                 raise ValueError('inconsistent length')
-            if self.dtype != other.dtype:
+            if self._x.dtype != other.dtype:
                 raise TypeError('inconsistent dtype')
 
-        return VectorArray2D(self.x - other.x, self.y - other.y)
+        return VectorArray2D(self._x - other.x, self._y - other.y)
 
     def __rsub__(self, *args, **kwargs):
 
@@ -253,19 +263,25 @@ class VectorArray2D(VectorArray, VectorArray2DABC):
         if not isinstance(other, VectorArray2DABC):
             return NotImplemented
 
-        if len(self) != len(other):
+        if len(self._x) != len(other):
             raise ValueError('inconsistent length')
-        if self.dtype != other.dtype:
+        if self._x.dtype != other.dtype:
             raise TypeError('inconsistent dtype')
 
-        return self.x * other.x + self.y * other.y
+        return self._x * other.x + self._y * other.y
 
     def as_list(self) -> List[Vector2D]:
         """
         Exports a list of :class:`bewegung.Vector2D` objects
         """
 
-        return list(self)
+        dtype = dtype_np2py(self.dtype)
+        meta = self._meta.items()
+
+        return [
+            Vector2D(x = x, y = y, dtype = dtype, meta = {key: value[idx] for key, value in meta})
+            for idx, (x, y) in enumerate(zip(self._x.tolist(), self._y.tolist())) # bulk conversion to Python numbers
+        ]
 
     def as_ndarray(self, dtype: Dtype = FLOAT_DEFAULT) -> np.ndarray:
         """
@@ -275,8 +291,7 @@ class VectorArray2D(VectorArray, VectorArray2DABC):
             dtype : Desired ``numpy`` data type of new vector
         """
 
-        a = np.zeros((len(self), 2), dtype = self.dtype)
-        a[:, 0], a[:, 1] = self._x, self._y
+        a = np.stack((self._x, self._y), axis = 1)
         return a if a.dtype == np.dtype(dtype) else a.astype(dtype)
 
     def as_polar_tuple(self) -> Tuple[np.ndarray, np.ndarray]:
@@ -307,18 +322,23 @@ class VectorArray2D(VectorArray, VectorArray2DABC):
             dtype : Desired ``numpy`` data type of new vector array
         """
 
-        return self.copy() if self.dtype == np.dtype(dtype) else VectorArray2D(
-            self._x.astype(dtype), self._y.astype(dtype),
-        )
+        if self.dtype == np.dtype(dtype):
+            return self.copy()
+
+        x, y = np.array((self._x, self._y), dtype = dtype) # one block, one row per component
+
+        return VectorArray2D(x, y)
 
     def copy(self) -> VectorArray2DABC:
         """
         Copies vector array & meta data
         """
 
+        x, y = np.stack((self._x, self._y)) # one block, one row per component
+
         return VectorArray2D(
-            x = self._x.copy(),
-            y = self._y.copy(),
+            x = x,
+            y = y,
             meta = {key: value.copy() for key, value in self._meta.items()},
         )
 
@@ -355,6 +375,11 @@ class VectorArray2D(VectorArray, VectorArray2DABC):
         The vectors' magnitudes, computed on demand
         """
 
+        if mag2_jit is not None and self._x.dtype in (np.float32, np.float64): # native byte order only
+            mag = np.empty_like(self._x)
+            mag2_jit(self._x, self._y, mag) # single pass
+            return mag
+
         return np.sqrt(self._x ** 2 + self._y ** 2)
 
     @property
@@ -404,20 +429,38 @@ class VectorArray2D(VectorArray, VectorArray2DABC):
         if not isinstance(obj, list):
             obj = list(obj)
 
-        x = np.zeros((len(obj),), dtype = dtype)
-        y = np.zeros((len(obj),), dtype = dtype)
-        keys = set()
-        for idx, item in enumerate(obj):
-            x[idx], y[idx] = item.x, item.y
-            keys.update(item.meta.keys())
+        x, y = np.array(
+            [(item._x, item._y) for item in obj], # bypasses type-checked properties
+            dtype = dtype,
+        ).reshape(len(obj), 2).T.copy() # one block, one row per component
+        keys = set().union(*(item._meta.keys() for item in obj))
 
         meta = {
-            key: np.array([item.meta.get(key) for item in obj])
+            key: np.array([item._meta.get(key) for item in obj])
             for key in keys
         }
 
         return cls(x = x, y = y, meta = meta,)
 
+    @classmethod
+    def from_ndarray(cls, obj: np.ndarray, dtype: Union[Dtype, None] = None, meta: Union[MetaArrayDict, None] = None) -> VectorArray2DABC:
+        """
+        Generates vector array object from a single ``numpy.ndarry`` object of shape ``(N, 2)``.
+        Counterpart of ``as_ndarray``. Components are copied, no :class:`bewegung.Vector2D` objects are created.
+
+        Args:
+            obj : Array of vectors, one vector per row
+            dtype : Desired ``numpy`` data type of new vector array. If ``None``, the data type of ``obj`` is used.
+            meta : A dict holding arbitrary metadata
+        """
+
+        if obj.ndim != 2 or obj.shape[1] != 2:
+            raise ValueError('inconsistent shape')
+
+        x, y = obj.T.copy() # one contiguous block of shape (2, N), one row per component
+
+        return cls(x = x, y = y, dtype = dtype, meta = meta,)
+
     @classmethod
     def from_polar(cls, radius: np.ndarray, angle: np.ndarray, meta: Union[MetaArrayDict, None] = None) -> VectorArray2DABC:
         """
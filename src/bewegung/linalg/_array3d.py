@@ -29,7 +29,7 @@ specific language governing rights and limitations under the License.
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
 from numbers import Number
-from typing import Any, List, Tuple, Union
+from typing import Any, Iterator, List, Tuple, Union
 
 from ..lib import typechecked
 from ._abc import (
@@ -41,6 +41,7 @@ from ._abc import (
 )
 from ._array import VectorArray
 from ._const import FLOAT_DEFAULT
+from ._kernels import mag3_jit
 from ._lib import dtype_np2py, dtype_name
 from ._numpy import np
 from ._single3d import Vector3D
@@ -111,14 +112,7 @@ class VectorArray3D(VectorArray, VectorArray3DABC):
         """
 
         if isinstance(idx, int):
-            dtype = dtype_np2py(self.dtype)
-            return Vector3D(
-                x = dtype(self._x[idx]),
-                y = dtype(self._y[idx]),
-                z = dtype(self._z[idx]),
-                dtype = dtype,
-                meta = {key: value[idx] for key, value in self._meta.items()},
-            )
+            return self._item(idx, dtype_np2py(self.dtype))
 
         return VectorArray3D(
             x = self._x[idx].copy(),
@@ -127,24 +121,40 @@ class VectorArray3D(VectorArray, VectorArray3DABC):
             meta = {key: value[idx].copy() for key, value in self._meta.items()},
         )
 
-    def __iter__(self) -> VectorArray3DABC:
+    def _item(self, idx, dtype): # called per element, not type-checked
+        return Vector3D(
+            x = dtype(self._x[idx]),
+            y = dtype(self._y[idx]),
+            z = dtype(self._z[idx]),
+            dtype = dtype,
+            meta = {key: value[idx] for key, value in self._meta.items()},
+        )
+
+    def __iter__(self) -> Iterator[Vector3D]:
         """
-        Iterator interface (1/2)
+        Iterator interface, returning an independent iterator.
+        Nested and concurrent iterations over the same array do not interfere.
         """
 
-        self._iterstate = 0
-        return self
+        return self._iter_items()
+
+    def _iter_items(self): # generator, not type-checked
+        dtype = dtype_np2py(self.dtype) # once per iteration
+        for idx in range(len(self)):
+            yield self._item(idx, dtype)
 
     def __next__(self) -> Vector3D:
         """
-        Iterator interface (2/2)
+        Stateful iteration via ``next``, independent of ``__iter__``
         """
 
         if self._iterstate == len(self):
             self._iterstate = 0 # reset
             raise StopIteration()
+        if self._iterstate == 0:
+            self._iterdtype = dtype_np2py(self.dtype) # once per iteration
 
-        value = self[self._iterstate]
+        value = self._item(self._iterstate, self._iterdtype)
         self._iterstate += 1 # increment
         return value
 
@@ -159,7 +169,7 @@ class VectorArray3D(VectorArray, VectorArray3DABC):
         if not isinstance(other, VectorArray3DABC):
             return NotImplemented
 
-        return np.array_equal(self.x, other.x) and np.array_equal(self.y, other.y) and np.array_equal(self.z, other.z)
+        return np.array_equal(self._x, other.x) and np.array_equal(self._y, other.y) and np.array_equal(self._z, other.z)
 
     def __mod__(self, other: Any) -> Union[bool, NotImplementedType]:
         """
@@ -172,7 +182,7 @@ class VectorArray3D(VectorArray, VectorArray3DABC):
         if not isinstance(other, VectorArray3DABC):
             return NotImplemented
 
-        return np.allclose(self.x, other.x) and np.allclose(self.y, other.y) and np.allclose(self.z, other.z)
+        return np.allclose(self._x, other.x) and np.allclose(self._y, other.y) and np.allclose(self._z, other.z)
 
     def __add__(self, other: Any) -> Union[VectorArray3DABC, NotImplementedType]:
         """
@@ -182,16 +192,16 @@ class VectorArray3D(VectorArray, VectorArray3DABC):
             other : Another vector array of equal length
         """
 
-        if not any(isinstance(other, t) for t in (VectorArray3DABC, Vector3D)):
+        if not isinstance(other, (VectorArray3DABC, Vector3D)):
             return NotImplemented
 
         if isinstance(other, VectorArray3DABC):
-            if len(self) != len(other):
+            if len(self._x) != len(other):
                 raise ValueError('inconsistent length')
-            if self.dtype != other.dtype:
+            if self._x.dtype != other.dtype:
                 raise TypeError('inconsistent dtype')
 
-        return VectorArray3D(self.x + other.x, self.y + other.y, self.z + other.z)
+        return VectorArray3D(self._x + other.x, self._y + other.y, self._z + other.z)
 
     def __radd__(self, *args, **kwargs):
 
@@ -205,16 +215,16 @@ class VectorArray3D(VectorArray, VectorArray3DABC):
             other : Another vector array of equal length
         """
 
-        if not any(isinstance(other, t) for t in (VectorArray3DABC, Vector3D)):
+        if not isinstance(other, (VectorArray3DABC, Vector3D)):
             return NotImplemented
 
         if isinstance(other, VectorArray3DABC):
-            if len(self) != len(other):
+            if len(self._x) != len(other):
                 raise ValueError('inconsistent length')
-            if self.dtype != other.dtype:
+            if self._x.dtype != other.dtype:
                 raise TypeError('inconsistent dtype')
 
-        return VectorArray3D(self.x - other.x, self.y - other.y, self.z - other.z)
+        return VectorArray3D(self._x - other.x, self._y - other.y, self._z - other.z)
 
     def __rsub__(self, *args, **kwargs):
 
@@ -260,19 +270,25 @@ class VectorArray3D(VectorArray, VectorArray3DABC):
         if not isinstance(other, VectorArray3DABC):
             return NotImplemented
 
-        if len(self) != len(other):
+        if len(self._x) != len(other):
             raise ValueError('inconsistent length')
-        if self.dtype != other.dtype:
+        if self._x.dtype != other.dtype:
             raise TypeError('inconsistent dtype')
 
-        return self.x * other.x + self.y * other.y + self.z * other.z
+        return self._x * other.x + self._y * other.y + self._z * other.z
 
     def as_list(self) -> List[Vector3D]:
         """
         Exports a list of :class:`bewegung.Vector3D` objects
         """
 
-        return list(self)
+        dtype = dtype_np2py(self.dtype)
+        meta = self._meta.items()
+
+        return [
+            Vector3D(x = x, y = y, z = z, dtype = dtype, meta = {key: value[idx] for key, value in meta})
+            for idx, (x, y, z) in enumerate(zip(self._x.tolist(), self._y.tolist(), self._z.tolist())) # bulk conversion to Python numbers
+        ]
 
     def as_ndarray(self, dtype: Dtype = FLOAT_DEFAULT) -> np.ndarray:
         """
@@ -282,8 +298,7 @@ class VectorArray3D(VectorArray, VectorArray3DABC):
             dtype : Desired ``numpy`` data type of new vector
         """
 
-        a = np.zeros((len(self), 3), dtype = self.dtype)
-        a[:, 0], a[:, 1], a[:, 2] = self._x, self._y, self._z
+        a = np.stack((self._x, self._y, self._z), axis = 1)
         return a if a.dtype == np.dtype(dtype) else a.astype(dtype)
 
     def as_polar_tuple(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -322,19 +337,24 @@ class VectorArray3D(VectorArray, VectorArray3DABC):
             dtype : Desired ``numpy`` data type of new vector array
         """
 
-        return self.copy() if self.dtype == np.dtype(dtype) else VectorArray3D(
-            self._x.astype(dtype), self._y.astype(dtype), self._z.astype(dtype),
-        )
+        if self.dtype == np.dtype(dtype):
+            return self.copy()
+
+        x, y, z = np.array((self._x, self._y, self._z), dtype = dtype) # one block, one row per component
+
+        return VectorArray3D(x, y, z)
 
     def copy(self) -> VectorArray3DABC:
         """
         Copies vector array & meta data
         """
 
+        x, y, z = np.stack((self._x, self._y, self._z)) # one block, one row per component
+
         return VectorArray3D(
-            x = self._x.copy(),
-            y = self._y.copy(),
-            z = self._z.copy(),
+            x = x,
+            y = y,
+            z = z,
             meta = {key: value.copy() for key, value in self._meta.items()},
         )
 
@@ -372,6 +392,11 @@ class VectorArray3D(VectorArray, VectorArray3DABC):
         The vectors' magnitudes, computed on demand
         """
 
+        if mag3_jit is not None and self._x.dtype in (np.float32, np.float64): # native byte order only
+            mag = np.empty_like(self._x)
+            mag3_jit(self._x, self._y, self._z, mag) # single pass
+            return mag
+
         return np.sqrt(self._x ** 2 + self._y ** 2 + self._z ** 2)
 
     @property
@@ -463,21 +488,38 @@ class VectorArray3D(VectorArray, VectorArray3DABC):
         if not isinstance(obj, list):
             obj = list(obj)
 
-        x = np.zeros((len(obj),), dtype = dtype)
-        y = np.zeros((len(obj),), dtype = dtype)
-        z = np.zeros((len(obj),), dtype = dtype)
-        keys = set()
-        for idx, item in enumerate(obj):
-            x[idx], y[idx], z[idx] = item.x, item.y, item.z
-            keys.update(item.meta.keys())
+        x, y, z = np.array(
+            [(item._x, item._y, item._z) for item in obj], # bypasses type-checked properties
+            dtype = dtype,
+        ).reshape(len(obj), 3).T.copy() # one block, one row per component
+        keys = set().union(*(item._meta.keys() for item in obj))
 
         meta = {
-            key: np.array([item.meta.get(key) for item in obj])
+            key: np.array([item._meta.get(key) for item in obj])
             for key in keys
         }
 
         return cls(x = x, y = y, z = z, meta = meta,)
 
+    @classmethod
+    def from_ndarray(cls, obj: np.ndarray, dtype: Union[Dtype, None] = None, meta: Union[MetaArrayDict, None] = None) -> VectorArray3DABC:
+        """
+        Generates vector array object from a single ``numpy.ndarry`` object of shape ``(N, 3)``.
+        Counterpart of ``as_ndarray``. Components are copied, no :class:`bewegung.Vector3D` objects are created.
+
+        Args:
+            obj : Array of vectors, one vector per row
+            dtype : Desired ``numpy`` data type of new vector array. If ``None``, the data type of ``obj`` is used.
+            meta : A dict holding arbitrary metadata
+        """
+
+        if obj.ndim != 2 or obj.shape[1] != 3:
+            raise ValueError('inconsistent shape')
+
+        x, y, z = obj.T.copy() # one contiguous block of shape (3, N), one row per component
+
+        return cls(x = x, y = y, z = z, dtype = dtype, meta = meta,)
+
     @classmethod
     def from_polar(cls, radius: np.ndarray, theta: np.ndarray, phi: np.ndarray, meta: Union[MetaArrayDict, None] = None) -> VectorArray3DABC:
         """
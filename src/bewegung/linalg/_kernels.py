@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+"""
+
+BEWEGUNG
+a versatile video renderer
+https://github.com/pleiszenburg/bewegung
+
+    src/bewegung/linalg/_kernels.py: JIT-compiled array kernels (optional)
+
+    Copyright (C) 2020-2022 Sebastian M. Ernst <ernst@pleiszenburg.de>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to the GNU Lesser General Public License
+Version 2.1 ("LGPL" or "License"). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/old-licenses/lgpl-2.1.txt
+https://github.com/pleiszenburg/bewegung/blob/master/LICENSE
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPORT
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import math
+
+try:
+    from numba import jit, types
+except ModuleNotFoundError:
+    jit = None
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# ROUTINES
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+if jit is not None:
+
+    def _components(dtype):
+        return types.Array(dtype, 1, 'A', readonly = True) # also matches writable arrays
+
+    @jit(
+        [
+            (_components(types.float32), _components(types.float32), types.float32[:]),
+            (_components(types.float64), _components(types.float64), types.float64[:]),
+        ],
+        nopython = True,
+        nogil = True,
+        cache = True,
+    )
+    def mag2_jit(x, y, out):
+        """
+        Magnitudes of 2D vectors in a single pass, without temporary arrays.
+        Results are identical to ``numpy.sqrt(x ** 2 + y ** 2)``.
+
+        Requires ``numpy`` and ``numba``.
+
+        Args:
+            x : x components, possibly read-only
+            y : y components, possibly read-only
+            out : Target array, same length and dtype like components
+        """
+
+        for index in range(x.shape[0]):
+            out[index] = math.sqrt(x[index] * x[index] + y[index] * y[index])
+
+    @jit(
+        [
+            (_components(types.float32), _components(types.float32), _components(types.float32), types.float32[:]),
+            (_components(types.float64), _components(types.float64), _components(types.float64), types.float64[:]),
+        ],
+        nopython = True,
+        nogil = True,
+        cache = True,
+    )
+    def mag3_jit(x, y, z, out):
+        """
+        Magnitudes of 3D vectors in a single pass, without temporary arrays.
+        Results are identical to ``numpy.sqrt(x ** 2 + y ** 2 + z ** 2)``.
+
+        Requires ``numpy`` and ``numba``.
+
+        Args:
+            x : x components, possibly read-only
+            y : y components, possibly read-only
+            z : z components, possibly read-only
+            out : Target array, same length and dtype like components
+        """
+
+        for index in range(x.shape[0]):
+            out[index] = math.sqrt(x[index] * x[index] + y[index] * y[index] + z[index] * z[index])
+
+else:
+
+    mag2_jit, mag3_jit = None, None
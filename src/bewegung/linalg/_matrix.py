@@ -111,7 +111,7 @@ class Matrix(MatrixABC):
             other : A 2D or 3D vector or array of vectors
         """
 
-        if not any(isinstance(other, t) for t in (Vector, VectorArray)):
+        if not isinstance(other, (Vector, VectorArray)):
             return NotImplemented
 
         if self.ndim != other.ndim:
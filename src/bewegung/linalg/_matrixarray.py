@@ -29,7 +29,7 @@ specific language governing rights and limitations under the License.
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
 from numbers import Number
-from typing import Any, List, Tuple, Union
+from typing import Any, Iterator, List, Tuple, Union
 
 from ..lib import typechecked
 from ._abc import (
@@ -132,7 +132,7 @@ class MatrixArray(MatrixArrayABC):
             vector : A 2D or 3D vector or array of vectors
         """
 
-        if not any(isinstance(other, t) for t in (Vector, VectorArray)):
+        if not isinstance(other, (Vector, VectorArray)):
             return NotImplemented
 
         if self.ndim != other.ndim:
@@ -171,8 +171,9 @@ class MatrixArray(MatrixArrayABC):
                 meta = {key: value[idx].copy() for key, value in self._meta.items()},
             )
 
-        dtype = dtype_np2py(self.dtype)
+        return self._item(idx, dtype_np2py(self.dtype))
 
+    def _item(self, idx, dtype): # called per element, not type-checked
         return Matrix(
             matrix = [
                 [dtype(col[idx]) for col in row]
@@ -181,24 +182,31 @@ class MatrixArray(MatrixArrayABC):
             meta = {key: value[idx] for key, value in self._meta.items()},
         )
 
-    def __iter__(self) -> MatrixArrayABC:
+    def __iter__(self) -> Iterator[Matrix]:
         """
-        Iterator interface (1/2)
+        Iterator interface, returning an independent iterator.
+        Nested and concurrent iterations over the same array do not interfere.
         """
 
-        self._iterstate = 0
-        return self
+        return self._iter_items()
+
+    def _iter_items(self): # generator, not type-checked
+        dtype = dtype_np2py(self.dtype) # once per iteration
+        for idx in range(len(self)):
+            yield self._item(idx, dtype)
 
     def __next__(self) -> Matrix:
         """
-        Iterator interface (2/2)
+        Stateful iteration via ``next``, independent of ``__iter__``
         """
 
         if self._iterstate == len(self):
             self._iterstate = 0 # reset
             raise StopIteration()
+        if self._iterstate == 0:
+            self._iterdtype = dtype_np2py(self.dtype) # once per iteration
 
-        value = self[self._iterstate]
+        value = self._item(self._iterstate, self._iterdtype)
         self._iterstate += 1 # increment
         return value
 
@@ -326,7 +326,8 @@ class Vector2D(Vector, Vector2DABC):
     @classmethod
     def from_polar(cls, radius: Number, angle: Number, meta: Union[MetaDict, None] = None) -> Vector2DABC:
         """
-        Generates vector object from polar coordinates
+        Generates vector object from polar coordinates.
+        For many vectors at once, use :meth:`bewegung.VectorArray2D.from_polar` instead.
 
         Args:
             radius : A radius
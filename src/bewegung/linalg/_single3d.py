@@ -378,7 +378,8 @@ class Vector3D(Vector, Vector3DABC):
     @classmethod
     def from_polar(cls, radius: Number, theta: Number, phi: Number, meta: Union[MetaDict, None] = None) -> Vector3DABC:
         """
-        Generates vector object from polar coordinates
+        Generates vector object from polar coordinates.
+        For many vectors at once, use :meth:`bewegung.VectorArray3D.from_polar` instead.
 
         Args:
             radius : A radius
@@ -398,7 +399,8 @@ class Vector3D(Vector, Vector3DABC):
     @classmethod
     def from_geographic(cls, radius: Number, lon: Number, lat: Number, meta: Union[MetaDict, None] = None) -> Vector3DABC:
         """
-        Generates vector object from geographic polar coordinates
+        Generates vector object from geographic polar coordinates.
+        For many vectors at once, use :meth:`bewegung.VectorArray3D.from_geographic` instead.
 
         Args:
             radius : A radius
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+"""
+
+BEWEGUNG
+a versatile video renderer
+https://github.com/pleiszenburg/bewegung
+
+    tests/animation/test_backends.py: Backend checks
+
+    Copyright (C) 2020-2022 Sebastian M. Ernst <ernst@pleiszenburg.de>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to the GNU Lesser General Public License
+Version 2.1 ("LGPL" or "License"). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/old-licenses/lgpl-2.1.txt
+https://github.com/pleiszenburg/bewegung/blob/master/LICENSE
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPORT
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import numpy as np
+import pytest
+
+from bewegung import Vector2D, Video
+from bewegung.animation import _video
+from bewegung.animation._backends import backends
+from bewegung.animation._composite import composite_jit
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# TESTS: DATASHADER
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+def _datashader_image(layout):
+
+    xr = pytest.importorskip('xarray')
+    tf = pytest.importorskip('datashader.transfer_functions')
+
+    rng = np.random.default_rng(seed = 0)
+    data = rng.integers(0, 2 ** 32, size = (24, 32), dtype = np.uint32)
+
+    data = {
+        'contiguous': data,
+        'rows': data[::2], # sliced
+        'columns': data[:, 3:20],
+        'reversed': data[::-1],
+    }[layout]
+
+    return tf.Image(xr.DataArray(data, dims = ['y', 'x'])), data
+
+@pytest.mark.parametrize('layout', ['contiguous', 'rows', 'columns', 'reversed'])
+def test_datashader_to_pil(layout):
+
+    img, data = _datashader_image(layout)
+    backend = backends['datashader']
+    backend.load()
+
+    cvs = backend.to_pil(img)
+    assert cvs.mode == 'RGBA'
+    assert cvs.size == (data.shape[1], data.shape[0])
+
+    shared = getattr(cvs, '__bewegung_array__', None)
+    if shared is None: # no fast path, compositor falls back to image
+        return
+
+    assert shared[0] is cvs.im
+    assert shared[1].flags.c_contiguous
+    assert shared[1].dtype == np.uint8
+    assert np.array_equal(shared[1], np.asarray(cvs))
+    if layout == 'contiguous':
+        assert np.shares_memory(shared[1], data) # no copy
+
+@pytest.mark.skipif(composite_jit is None, reason = 'requires numba')
+@pytest.mark.parametrize('layout', ['contiguous', 'rows', 'columns', 'reversed'])
+def test_datashader_composite(layout, monkeypatch):
+
+    img, _ = _datashader_image(layout)
+    backends['datashader'].load()
+
+    v = Video(width = 40, height = 30, frames = 1)
+
+    @v.sequence()
+    class Shade:
+
+        @v.layer(canvas = v.canvas(backend = 'pillow'), offset = Vector2D(-3, 5))
+        def layer(self):
+            return img
+
+    v.reset()
+    frame_jit = np.array(v._render_frame(v.time(0)))
+
+    monkeypatch.setattr(_video, 'composite_jit', None) # pillow fallback
+    v.reset()
+    frame_pil = np.array(v._render_frame(v.time(0)))
+
+    assert np.array_equal(frame_jit, frame_pil)
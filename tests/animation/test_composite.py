@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+"""
+
+BEWEGUNG
+a versatile video renderer
+https://github.com/pleiszenburg/bewegung
+
+    tests/animation/test_composite.py: Compositing checks
+
+    Copyright (C) 2020-2022 Sebastian M. Ernst <ernst@pleiszenburg.de>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to the GNU Lesser General Public License
+Version 2.1 ("LGPL" or "License"). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/old-licenses/lgpl-2.1.txt
+https://github.com/pleiszenburg/bewegung/blob/master/LICENSE
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPORT
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import numpy as np
+from PIL import Image
+import pytest
+
+from bewegung import Vector2D, Video
+from bewegung.animation import _video
+from bewegung.animation._composite import composite_jit
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# HELPER
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+WIDTH, HEIGHT, FRAMES = 64, 48, 4
+
+LAYERS = [ # size and offset of every layer, in order of z-index
+    ((WIDTH, HEIGHT), (0, 0)), # full frame
+    ((20, 10), (5, 7)), # in bounds
+    ((30, 25), (50, 30)), # partially off frame, bottom right
+    ((25, 30), (-10, -12)), # negative offsets, top left
+    ((15, 40), (-5, 20)), # negative and positive offset, off frame at bottom
+    ((WIDTH + 10, 6), (-5, 3)), # wider than frame
+    ((10, 10), (WIDTH + 5, 0)), # outside of frame
+    ((10, 10), (-10, -10)), # outside of frame, negative offsets
+]
+
+def _layer_array(rng, width, height):
+
+    rgba = rng.integers(0, 256, size = (height, width, 4), dtype = np.uint8)
+    alpha = rgba[:, :, 3]
+    selector = rng.random(size = alpha.shape)
+    alpha[selector < 0.2] = 0 # fully transparent
+    alpha[selector > 0.8] = 255 # fully opaque
+
+    return rgba
+
+def _video_random_layers():
+
+    rng = np.random.default_rng(seed = 0)
+    arrays = [
+        [_layer_array(rng, *size) for size, _ in LAYERS]
+        for _ in range(FRAMES)
+    ] # per frame, per layer
+
+    v = Video(width = WIDTH, height = HEIGHT, frames = FRAMES)
+
+    for zindex, (_, offset) in enumerate(LAYERS):
+
+        @v.sequence()
+        class Random:
+
+            index = zindex
+
+            @v.layer(zindex = zindex, canvas = v.canvas(backend = 'pillow'), offset = Vector2D(*offset))
+            def layer(self, time):
+                return Image.fromarray(arrays[time.index][self.index], 'RGBA')
+
+    return v
+
+def _render_frames(v, buffered):
+
+    v.reset()
+    frames = []
+
+    for index in range(FRAMES):
+        if buffered:
+            buffer = bytearray(WIDTH * HEIGHT * 3)
+            v._render_frame(v.time(index), buffer = buffer, image = False)
+            frames.append(np.frombuffer(bytes(buffer), dtype = np.uint8).reshape(HEIGHT, WIDTH, 3))
+        else:
+            frame = v._render_frame(v.time(index))
+            assert frame.mode == 'RGB'
+            assert frame.size == (WIDTH, HEIGHT)
+            frames.append(np.array(frame))
+
+    return frames
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# TESTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+@pytest.mark.skipif(composite_jit is None, reason = 'requires numba')
+@pytest.mark.parametrize('buffered', [False, True])
+def test_composite_jit_pil(buffered, monkeypatch):
+
+    v = _video_random_layers()
+
+    frames_jit = _render_frames(v, buffered)
+
+    monkeypatch.setattr(_video, 'composite_jit', None) # pillow fallback
+    frames_pil = _render_frames(v, buffered)
+
+    for frame_jit, frame_pil in zip(frames_jit, frames_pil):
+        assert np.array_equal(frame_jit, frame_pil)
+
+    assert not np.array_equal(frames_jit[0], frames_jit[1]) # frames differ, buffer is cleared between them
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+"""
+
+BEWEGUNG
+a versatile video renderer
+https://github.com/pleiszenburg/bewegung
+
+    tests/animation/test_render.py: Rendering checks
+
+    Copyright (C) 2020-2022 Sebastian M. Ernst <ernst@pleiszenburg.de>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to the GNU Lesser General Public License
+Version 2.1 ("LGPL" or "License"). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/old-licenses/lgpl-2.1.txt
+https://github.com/pleiszenburg/bewegung/blob/master/LICENSE
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPORT
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import pytest
+
+from bewegung import Video
+from bewegung.animation._const import CHUNK_BYTES_MAX, CHUNKS_IN_FLIGHT, SHARED_BYTES_MAX
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# TESTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+@pytest.mark.parametrize('width, height', [(64, 48), (1920, 1080), (3840, 2160), (16384, 16384)])
+@pytest.mark.parametrize('processes', [1, 4, 16, 64])
+def test_chunksize_max(width, height, processes):
+
+    v = Video(width = width, height = height, frames = 10)
+    size = width * height * 3
+
+    chunksize = v._chunksize_max(processes)
+    assert chunksize >= 1
+
+    if chunksize > 1: # a single frame per chunk is never reduced further
+        assert chunksize * size <= CHUNK_BYTES_MAX
+        assert CHUNKS_IN_FLIGHT * processes * chunksize * size <= SHARED_BYTES_MAX # ring of slots fits
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+
+"""
+
+BEWEGUNG
+a versatile video renderer
+https://github.com/pleiszenburg/bewegung
+
+    tests/lib/test_colorarray.py: Color array checks
+
+    Copyright (C) 2020-2022 Sebastian M. Ernst <ernst@pleiszenburg.de>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to the GNU Lesser General Public License
+Version 2.1 ("LGPL" or "License"). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/old-licenses/lgpl-2.1.txt
+https://github.com/pleiszenburg/bewegung/blob/master/LICENSE
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPORT
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import numpy as np
+import pytest
+
+from bewegung import Color, ColorArray
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# TESTS
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+def _colors():
+
+    return [Color(255, 0, 0), Color(0, 255, 0, 128), Color(0, 0, 255, 0), Color(10, 20, 30, 40)]
+
+def test_init():
+
+    ca = ColorArray(np.zeros((3, 4), dtype = np.uint8))
+    assert len(ca) == 3
+    assert 'ColorArray' in repr(ca)
+
+    assert len(ColorArray(np.zeros((0, 4), dtype = np.uint8))) == 0
+
+def test_init_error():
+
+    for shape in ((4,), (3, 3), (3, 5), (4, 3), (3, 4, 1)):
+        with pytest.raises(ValueError):
+            _ = ColorArray(np.zeros(shape, dtype = np.uint8))
+
+    for dtype in ('u2', 'i1', 'i8', 'f4', 'f8'):
+        with pytest.raises(TypeError):
+            _ = ColorArray(np.zeros((3, 4), dtype = dtype))
+
+def test_from_iterable():
+
+    colors = _colors()
+
+    ca = ColorArray.from_iterable(colors)
+    assert len(ca) == len(colors)
+    assert [color.as_rgba_int() for color in ca.as_list()] == [color.as_rgba_int() for color in colors]
+
+    ca = ColorArray.from_iterable(color for color in colors) # generator
+    assert len(ca) == len(colors)
+
+def test_from_iterable_empty():
+
+    for obj in ([], (), iter([])):
+        ca = ColorArray.from_iterable(obj)
+        assert len(ca) == 0
+        assert ca.as_rgba_int().shape == (0, 4)
+        assert ca.as_rgba_int().dtype == np.uint8
+        assert ca.as_list() == []
+
+@pytest.mark.parametrize('idx', [1, -1, np.int64(1), np.int32(2), np.uint8(3), np.intp(-2)])
+def test_getitem_index(idx):
+
+    colors = _colors()
+    ca = ColorArray.from_iterable(colors)
+
+    color = ca[idx]
+    assert isinstance(color, Color)
+    assert color.as_rgba_int() == colors[int(idx)].as_rgba_int()
+
+def test_getitem_index_error():
+
+    ca = ColorArray.from_iterable(_colors())
+
+    with pytest.raises(IndexError):
+        _ = ca[4]
+    with pytest.raises(IndexError):
+        _ = ca[np.int64(-5)]
+
+def test_getitem_slice():
+
+    colors = _colors()
+    ca = ColorArray.from_iterable(colors)
+
+    sliced = ca[1:3]
+    assert isinstance(sliced, ColorArray)
+    assert [color.as_rgba_int() for color in sliced.as_list()] == [color.as_rgba_int() for color in colors[1:3]]
+    assert len(ca[::-1]) == len(colors)
+
+    sliced.as_rgba_int(copy = False)[:] = 7 # slices are independent
+    assert [color.as_rgba_int() for color in ca.as_list()] == [color.as_rgba_int() for color in colors]
+
+    ca.as_rgba_int(copy = False)[:] = 9
+    assert np.all(sliced.as_rgba_int() == 7)
+
+def test_as_rgba_int_copy():
+
+    ca = ColorArray.from_iterable(_colors())
+
+    copy = ca.as_rgba_int()
+    copy[:] = 0
+    assert ca[0].as_rgba_int() == (255, 0, 0, 255)
+
+    view = ca.as_rgba_int(copy = False) # aliases underlying array
+    view[0] = (1, 2, 3, 4)
+    assert ca[0].as_rgba_int() == (1, 2, 3, 4)
+    assert ca.as_rgba_int(copy = False) is view
+
+def test_as_rgba_float():
+
+    colors = _colors()
+    ca = ColorArray.from_iterable(colors)
+
+    for dtype in ('f4', 'f8'):
+        rgba = ca.as_rgba_float(dtype = dtype)
+        assert rgba.dtype == np.dtype(dtype)
+        assert rgba.shape == (len(colors), 4)
+        assert np.allclose(rgba, [color.as_rgba_float() for color in colors])
+
+def _hsv_expected(h, s, v):
+
+    return [Color.from_hsv(float(hh), float(ss), float(vv)).as_rgba_int() for hh, ss, vv in zip(h, s, v)]
+
+def test_from_hsv():
+
+    rng = np.random.default_rng(seed = 0)
+
+    h = np.concatenate((np.arange(0.0, 361.0, 15.0), [59.999, 60.0, 60.001, 359.999], rng.uniform(0.0, 360.0, 500)))
+    s = np.concatenate((np.linspace(0.0, 1.0, 25), [1.0, 0.5, 0.0, 1.0], rng.uniform(0.0, 1.0, 500)))
+    v = np.concatenate((np.linspace(1.0, 0.0, 25), [1.0, 1.0, 0.5, 1.0], rng.uniform(0.0, 1.0, 500)))
+
+    ca = ColorArray.from_hsv(h, s, v)
+    assert len(ca) == h.shape[0]
+    assert [tuple(rgba) for rgba in ca.as_rgba_int().tolist()] == _hsv_expected(h, s, v) # channel for channel
+
+@pytest.mark.parametrize('h', [0.0, 60.0, 120.0, 180.0, 240.0, 300.0, 360.0])
+@pytest.mark.parametrize('s, v', [(1.0, 1.0), (0.5, 0.75), (0.0, 1.0), (1.0, 0.0)])
+def test_from_hsv_sectors(h, s, v):
+
+    h, s, v = np.array([h]), np.array([s]), np.array([v])
+
+    assert ColorArray.from_hsv(h, s, v)[0].as_rgba_int() == _hsv_expected(h, s, v)[0]
+
+def test_from_hsv_scalar():
+
+    ca = ColorArray.from_hsv(np.array(360.0), np.array(1.0), np.array(1.0)) # zero-dimensional
+    assert len(ca) == 1
+    assert ca[0].as_rgba_int() == Color.from_hsv(360.0, 1.0, 1.0).as_rgba_int()
+
+    ca = ColorArray.from_hsv(np.array([]), np.array([]), np.array([]))
+    assert len(ca) == 0
+
+def test_from_hsv_error():
+
+    ones = np.ones((3,))
+
+    with pytest.raises(ValueError):
+        _ = ColorArray.from_hsv(ones * 361.0, ones, ones)
+    with pytest.raises(ValueError):
+        _ = ColorArray.from_hsv(-ones, ones, ones)
+    with pytest.raises(ValueError):
+        _ = ColorArray.from_hsv(ones, ones * 1.5, ones)
+    with pytest.raises(ValueError):
+        _ = ColorArray.from_hsv(ones, ones, -ones)
+    with pytest.raises(ValueError):
+        _ = ColorArray.from_hsv(ones, ones[:2], ones)
+    with pytest.raises(ValueError):
+        _ = ColorArray.from_hsv(ones.reshape(3, 1), ones.reshape(3, 1), ones.reshape(3, 1))
@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+
+"""
+
+BEWEGUNG
+a versatile video renderer
+https://github.com/pleiszenburg/bewegung
+
+    tests/linalg/test_array_checks.py: Vector array checks
+
+    Copyright (C) 2020-2022 Sebastian M. Ernst <ernst@pleiszenburg.de>
+
+<LICENSE_BLOCK>
+The contents of this file are subject to the GNU Lesser General Public License
+Version 2.1 ("LGPL" or "License"). You may not use this file except in
+compliance with the License. You may obtain a copy of the License at
+https://www.gnu.org/licenses/old-licenses/lgpl-2.1.txt
+https://github.com/pleiszenburg/bewegung/blob/master/LICENSE
+
+Software distributed under the License is distributed on an "AS IS" basis,
+WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License for the
+specific language governing rights and limitations under the License.
+</LICENSE_BLOCK>
+
+"""
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# IMPORT
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+import numpy as np
+import pytest
+
+from bewegung import MatrixArray, VectorArray2D, VectorArray3D
+from bewegung.linalg._kernels import mag2_jit, mag3_jit
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# TESTS: FROM NDARRAY
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+@pytest.mark.parametrize('cls, ndim', [(VectorArray2D, 2), (VectorArray3D, 3)])
+def test_from_ndarray(cls, ndim):
+
+    a = np.arange(5 * ndim, dtype = 'f8').reshape(5, ndim)
+    va = cls.from_ndarray(a)
+
+    assert len(va) == 5
+    assert va.ndim == ndim
+    assert va.dtype == np.dtype('f8')
+    assert np.array_equal(va.as_ndarray(), a)
+    assert va.meta == {}
+
+@pytest.mark.parametrize('cls, ndim', [(VectorArray2D, 2), (VectorArray3D, 3)])
+def test_from_ndarray_shape(cls, ndim):
+
+    for shape in ((5,), (5, ndim - 1), (5, ndim + 1), (ndim, 5), (5, ndim, 1)):
+        with pytest.raises(ValueError):
+            _ = cls.from_ndarray(np.zeros(shape))
+
+    assert len(cls.from_ndarray(np.zeros((0, ndim)))) == 0
+
+@pytest.mark.parametrize('cls, ndim', [(VectorArray2D, 2), (VectorArray3D, 3)])
+def test_from_ndarray_dtype(cls, ndim):
+
+    a = np.arange(4 * ndim, dtype = 'i8').reshape(4, ndim)
+
+    va = cls.from_ndarray(a)
+    assert va.dtype == np.dtype('i8')
+
+    for dtype in ('f4', 'f8', 'i4'):
+        va = cls.from_ndarray(a, dtype = dtype)
+        assert va.dtype == np.dtype(dtype)
+        assert np.array_equal(va.as_ndarray(dtype = dtype), a.astype(dtype))
+
+    va = cls.from_ndarray(a + 0.75, dtype = 'i8') # truncated like numpy.ndarray.astype
+    assert np.array_equal(va.as_ndarray(dtype = 'i8'), (a + 0.75).astype('i8'))
+
+@pytest.mark.parametrize('cls, ndim', [(VectorArray2D, 2), (VectorArray3D, 3)])
+def test_from_ndarray_meta(cls, ndim):
+
+    a = np.zeros((3, ndim))
+    names = np.array(['a', 'b', 'c'])
+
+    va = cls.from_ndarray(a, meta = dict(names = names))
+    assert list(va.meta.keys()) == ['names']
+    assert np.array_equal(va.meta['names'], names)
+    assert va[1:].meta['names'].tolist() == ['b', 'c']
+
+    with pytest.raises(ValueError):
+        _ = cls.from_ndarray(a, meta = dict(names = names[:2]))
+    with pytest.raises(ValueError):
+        _ = cls.from_ndarray(a, meta = dict(names = names.reshape(3, 1)))
+
+@pytest.mark.parametrize('cls, ndim', [(VectorArray2D, 2), (VectorArray3D, 3)])
+@pytest.mark.parametrize('order', ['C', 'F'])
+def test_from_ndarray_copy(cls, ndim, order):
+
+    a = np.array(np.arange(4 * ndim, dtype = 'f8').reshape(4, ndim), order = order)
+    expected = a.copy()
+    va = cls.from_ndarray(a)
+
+    assert not np.shares_memory(va.x, a)
+    assert va.x.flags.c_contiguous
+
+    a[:] = -1.0 # components are copied, not aliased
+    assert np.array_equal(va.as_ndarray(), expected)
+
+    va.x[:] = 7.0
+    assert np.array_equal(a, np.full_like(a, -1.0))
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# TESTS: ITERATION
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+def _arrays():
+
+    return [
+        VectorArray2D.from_ndarray(np.arange(10, dtype = 'f8').reshape(5, 2)),
+        VectorArray3D.from_ndarray(np.arange(15, dtype = 'f8').reshape(5, 3)),
+        MatrixArray.from_ndarray(np.arange(20, dtype = 'f8').reshape(5, 2, 2)),
+        MatrixArray.from_ndarray(np.arange(45, dtype = 'f8').reshape(5, 3, 3)),
+    ]
+
+@pytest.mark.parametrize('array', _arrays(), ids = lambda array: type(array).__name__)
+def test_iter_interleaved(array):
+
+    expected = [array[idx] for idx in range(len(array))]
+
+    it1, it2 = iter(array), iter(array)
+    assert it1 is not it2
+
+    items1, items2 = [], []
+    for item in it1: # advance both iterators alternately
+        items1.append(item)
+        items2.append(next(it2))
+    items2.extend(it2)
+
+    assert items1 == expected
+    assert items2 == expected
+
+@pytest.mark.parametrize('array', _arrays(), ids = lambda array: type(array).__name__)
+def test_iter_nested(array):
+
+    pairs = [(outer, inner) for outer in array for inner in array]
+    expected = [(array[i], array[j]) for i in range(len(array)) for j in range(len(array))]
+
+    assert pairs == expected
+
+@pytest.mark.parametrize('array', _arrays(), ids = lambda array: type(array).__name__)
+def test_next_independent(array):
+
+    expected = [array[idx] for idx in range(len(array))]
+
+    assert next(array) == expected[0] # stateful ``__next__`` is kept
+    assert list(array) == expected # not affected by ``__next__``
+    assert next(array) == expected[1]
+
+    rest = []
+    while True:
+        try:
+            rest.append(next(array))
+        except StopIteration:
+            break
+    assert rest == expected[2:]
+    assert next(array) == expected[0] # reset after StopIteration
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# TESTS: MAGNITUDE
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+_DTYPES = ['f4', 'f8', '>f4', '>f8', 'f2', 'i4', 'i8']
+
+def _components(ndim, dtype, contiguous = True):
+
+    rng = np.random.default_rng(seed = 0) # squares within range of float16
+    if np.dtype(dtype).kind == 'i':
+        data = rng.integers(-100, 100, size = (ndim, 64))
+    else:
+        data = rng.uniform(-100.0, 100.0, size = (ndim, 64))
+    data = data.astype(dtype)
+    if not contiguous:
+        data = np.repeat(data, 2, axis = 1)[:, ::2]
+    return list(data)
+
+@pytest.mark.parametrize('contiguous', [True, False])
+@pytest.mark.parametrize('dtype', _DTYPES)
+def test_mag2d(dtype, contiguous):
+
+    x, y = _components(2, dtype, contiguous)
+    mag = VectorArray2D(x, y).mag
+
+    expected = np.sqrt(x ** 2 + y ** 2)
+    assert mag.dtype == expected.dtype
+    assert np.array_equal(mag, expected)
+
+@pytest.mark.parametrize('contiguous', [True, False])
+@pytest.mark.parametrize('dtype', _DTYPES)
+def test_mag3d(dtype, contiguous):
+
+    x, y, z = _components(3, dtype, contiguous)
+    mag = VectorArray3D(x, y, z).mag
+
+    expected = np.sqrt(x ** 2 + y ** 2 + z ** 2)
+    assert mag.dtype == expected.dtype
+    assert np.array_equal(mag, expected)
+
+@pytest.mark.skipif(mag2_jit is None, reason = 'requires numba')
+@pytest.mark.parametrize('contiguous', [True, False])
+@pytest.mark.parametrize('dtype', ['f4', 'f8'])
+def test_mag_jit(dtype, contiguous):
+
+    x, y, z = _components(3, dtype, contiguous)
+
+    mag2 = np.empty_like(x)
+    mag2_jit(x, y, mag2)
+    assert np.array_equal(mag2, np.sqrt(x ** 2 + y ** 2))
+
+    mag3 = np.empty_like(x)
+    mag3_jit(x, y, z, mag3)
+    assert np.array_equal(mag3, np.sqrt(x ** 2 + y ** 2 + z ** 2))
+
+def _readonly(data, kind):
+
+    if kind == 'flag':
+        data = data.copy()
+        data.flags.writeable = False
+        return data
+    if kind == 'frombuffer':
+        return np.frombuffer(data.tobytes(), dtype = data.dtype)
+    if kind == 'broadcast':
+        return np.broadcast_to(data[:1], data.shape)
+    raise ValueError('unknown kind')
+
+@pytest.mark.parametrize('kind', ['flag', 'frombuffer', 'broadcast'])
+@pytest.mark.parametrize('dtype', ['f4', 'f8', 'i8'])
+def test_mag2d_readonly(dtype, kind):
+
+    x, y = _components(2, dtype)
+    xr, yr = _readonly(x, kind), _readonly(y, kind)
+    assert not xr.flags.writeable
+
+    for a, b in ((xr, yr), (xr, y), (x, yr)): # read-only and mixed
+        va = VectorArray2D(a, b)
+        assert np.array_equal(va.mag, np.sqrt(a ** 2 + b ** 2))
+        assert np.array_equal(va.angle, VectorArray2D(a.copy(), b.copy()).angle)
+
+@pytest.mark.parametrize('kind', ['flag', 'frombuffer', 'broadcast'])
+@pytest.mark.parametrize('dtype', ['f4', 'f8', 'i8'])
+def test_mag3d_readonly(dtype, kind):
+
+    x, y, z = _components(3, dtype)
+    xr, yr, zr = _readonly(x, kind), _readonly(y, kind), _readonly(z, kind)
+    assert not xr.flags.writeable
+
+    for a, b, c in ((xr, yr, zr), (x, yr, z), (xr, y, zr)): # read-only and mixed
+        va = VectorArray3D(a, b, c)
+        assert np.array_equal(va.mag, np.sqrt(a ** 2 + b ** 2 + c ** 2))
+        assert np.array_equal(va.theta, VectorArray3D(a.copy(), b.copy(), c.copy()).theta)